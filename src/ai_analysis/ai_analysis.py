@@ -4,27 +4,49 @@ src/ai_analysis/ai_analysis.py
 AI ile yorum analizi ve özet çıkarma modülü.
 - OpenAI GPT kullanarak yorumları özetler
 - Chunk-based processing (büyük yorum setleri için)
+- Chunk'lar asyncio ile eşzamanlı özetlenir (AsyncLLMClient)
+- Ürünler ThreadPoolExecutor ile paralel işlenir
 - Retry logic ile API hatalarını yönetir
+- TokenBucket ile RPM/TPM limitleri aşılmadan istekler hemen gönderilir
+- Prompt önbelleği: aynı prompt tekrar gönderilmez, opsiyonel olarak benzerleri de
 """
 
+import re
+import csv
 import json
-import time
+import asyncio
+import argparse
 import logging
-from typing import List, Dict, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Callable, Deque, Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 import pandas as pd
 import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
 )
 
+try:
+    import orjson  # opsiyonel: C tabanlı, json'dan birkaç kat hızlı
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from src.config.config_settings import settings
+from src.ai_analysis.prompt_cache import ExactCache, SemanticCache
+from src.ai_analysis.rate_limit import TokenBucket, estimate_tokens, truncate_tokens
+from src.ai_analysis.dedup import group_near_duplicates
+from src.data_processing.review_data import iter_grouped_reviews
 
 
 logger = logging.getLogger(__name__)
@@ -71,6 +93,43 @@ class ReviewSummary:
         }
 
 
+# to_dict() anahtarları = özet CSV'sinin sütunları
+SUMMARY_COLUMNS = [
+    "product_id", "ai_summary", "positive_points", "negative_points",
+    "price_performance", "packaging", "shipping", "sentiment", "reviews_count",
+]
+
+
+# ─────────────────────────────────────────
+# RETRY BEKLEMESİ
+# ─────────────────────────────────────────
+
+MAX_RETRY_WAIT = 60  # saniye
+
+_backoff = wait_random_exponential(min=1, max=MAX_RETRY_WAIT)
+
+
+def wait_retry_after(retry_state) -> float:
+    """
+    Tenacity bekleme stratejisi: sunucu Retry-After döndürdüyse o kadar bekle,
+    döndürmediyse jitter'lı exponential backoff (1s → 60s).
+
+    async fonksiyonlarda tenacity asyncio.sleep kullanır, event loop bloklanmaz.
+    """
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        headers = response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return min(float(headers["retry-after-ms"]) / 1000, MAX_RETRY_WAIT)
+            if "retry-after" in headers:
+                return min(float(headers["retry-after"]), MAX_RETRY_WAIT)
+        except ValueError:
+            pass  # HTTP-date formatı vb. → backoff
+
+    return _backoff(retry_state)
+
+
 # ─────────────────────────────────────────
 # LLM CLIENT  (OpenAI sarıcı)
 # ─────────────────────────────────────────
@@ -80,12 +139,14 @@ class LLMClient:
     OpenAI API ile konuşan client.
 
     Özellikler:
-    - Otomatik retry (RateLimitError, APIError)
+    - Otomatik retry (RateLimitError, APIError), Retry-After süresine uyar
+    - RPM/TPM token bucket (istekten önce yer açılmasını bekler)
     - Token kullanım takibi
+    - Prompt cache (settings.PROMPT_CACHE) + semantic cache (settings.SEMANTIC_CACHE)
     - Logging
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         self.api_key = api_key or settings.OPENAI_API_KEY
 
         if not self.api_key:
@@ -97,60 +158,253 @@ class LLMClient:
         self.client = OpenAI(api_key=self.api_key)
         self.model = settings.AI_MODEL
 
-        # Kullanım istatistikleri
+        # Kullanım istatistikleri (birden fazla thread'den güncellenir)
         self.total_requests = 0
         self.total_tokens = 0
+        self._stats_lock = threading.Lock()
+
+        # Dakikalık istek / token limitleri
+        self.bucket = TokenBucket(rpm=settings.AI_RPM, tpm=settings.AI_TPM)
+
+        # Önbellekler (embedding modeli ilk prompt'ta yüklenir)
+        use_cache = use_cache and settings.PROMPT_CACHE
+        self.exact_cache = ExactCache() if use_cache else None
+        self.cache = SemanticCache() if use_cache and settings.SEMANTIC_CACHE else None
 
         logger.info(f"LLM Client hazır → model: {self.model}")
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=wait_retry_after,
         retry=retry_if_exception_type((openai.RateLimitError, openai.APIError)),
     )
-    def generate(self, prompt: str, max_tokens: int = 1000) -> str:
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        response_format: Optional[Dict] = None,
+        model: Optional[str] = None,
+        semantic: Optional[Tuple[str, str]] = None,
+    ) -> str:
         """
         OpenAI'a prompt gönderir, yanıt döndürür.
 
         Args:
             prompt: Gönderilecek prompt metni
             max_tokens: Max çıktı token sayısı
+            response_format: Örn. JSON_MODE → model sadece geçerli JSON döndürür
+            model: Bu istek için model (None → self.model)
+            semantic: (prompt türü, yorum metni) — verilirse semantic cache'te aranır;
+                None → sadece birebir önbellek (final / direct özetler ürüne özeldir)
 
         Returns:
             Yapay zeka yanıtı (string)
         """
+        model = model or self.model
+        cached = self.cached(prompt, max_tokens, model, semantic)
+        if cached is not None:
+            return cached
+
+        self.bucket.acquire(1, estimate_tokens(model, prompt) + max_tokens)
+
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
+                model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=0.7,
+                **({"response_format": response_format} if response_format else {}),
             )
 
             # İstatistik güncelle
-            self.total_requests += 1
-            if response.usage:
-                self.total_tokens += response.usage.total_tokens
+            self.add_usage(response.usage.total_tokens if response.usage else 0)
 
             content = response.choices[0].message.content
             logger.debug(f"Yanıt geldi: {len(content)} karakter")
+
+            self.remember(prompt, max_tokens, model, content, semantic)
             return content
 
         except openai.RateLimitError:
-            logger.warning("Rate limit doldu, 60s beklenecek...")
-            time.sleep(60)
+            logger.warning("Rate limit (429) alındı, tekrar denenecek...")
             raise  # retry decorator tekrar deneyecek
 
         except openai.APIError as e:
             logger.error(f"API hata: {e}")
             raise
 
+    def add_usage(self, tokens: int, requests: int = 1) -> None:
+        """İstek / token sayaçlarını thread-safe artırır."""
+        with self._stats_lock:
+            self.total_requests += requests
+            self.total_tokens += tokens
+
+    # ── Önbellek ──
+    def cached(
+        self,
+        prompt: str,
+        max_tokens: int,
+        model: str,
+        semantic: Optional[Tuple[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Önce birebir eşleşme, sonra (açıksa ve istendiyse) semantic eşleşme arar.
+
+        Önbellek kapalıysa (use_cache=False) her zaman None döner.
+        """
+        if self.exact_cache is not None:
+            cached = self.exact_cache.get(ExactCache.key(model, max_tokens, prompt))
+            if cached is not None:
+                return cached
+
+        if self.cache is not None and semantic is not None:
+            kind, text = semantic
+            return self.cache.get(text, f"{model}|{kind}|{max_tokens}")
+        return None
+
+    def remember(
+        self,
+        prompt: str,
+        max_tokens: int,
+        model: str,
+        content: str,
+        semantic: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        """Yanıtı açık olan önbelleklere kaydeder (cached() ile aynı anahtarlar)."""
+        if self.exact_cache is not None:
+            self.exact_cache.put(ExactCache.key(model, max_tokens, prompt), content)
+        if self.cache is not None and semantic is not None:
+            kind, text = semantic
+            self.cache.put(text, f"{model}|{kind}|{max_tokens}", content)
+
+    def close(self) -> None:
+        """Önbellekleri diske yazar."""
+        if self.exact_cache is not None:
+            self.exact_cache.close()
+        if self.cache is not None:
+            self.cache.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Çalıştırma yarıda kesilse de (API hatası, Ctrl+C) ödenmiş yanıtlar diske yazılır
+        self.close()
+
     def get_usage_stats(self) -> Dict:
         """Kullanım istatistiklerini döndür."""
-        return {
+        stats = {
             "total_requests": self.total_requests,
             "total_tokens": self.total_tokens,
         }
+        if self.exact_cache is not None:
+            stats["cache_hits"] = self.exact_cache.hits
+        if self.cache is not None:
+            stats["semantic_cache_hits"] = self.cache.hits
+        return stats
+
+
+# Çalışan event loop'a ait AsyncOpenAI bağlantısı (AsyncLLMClient.session() ayarlar)
+_async_openai: ContextVar[Optional[AsyncOpenAI]] = ContextVar("_async_openai", default=None)
+
+
+class AsyncLLMClient(LLMClient):
+    """
+    LLMClient'ın asenkron versiyonu.
+
+    Özellikler:
+    - agenerate(): await edilebilir generate, aynı retry kuralları
+    - session(): her event loop için tek bir AsyncOpenAI bağlantısı açar / kapatır
+    - Senkron generate() (final özet vb.) aynen çalışmaya devam eder
+
+    Kullanımı:
+        async with llm.session():
+            results = await asyncio.gather(*(llm.agenerate(p) for p in prompts))
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True,
+    ):
+        super().__init__(api_key=api_key, use_cache=use_cache)
+        self.max_concurrency = max_concurrency or settings.MAX_CONCURRENCY
+
+    @asynccontextmanager
+    async def session(self):
+        """AsyncOpenAI client'ını bu event loop için açar, blok bitince kapatır."""
+        client = AsyncOpenAI(api_key=self.api_key)
+        token = _async_openai.set(client)
+        try:
+            yield self
+        finally:
+            _async_openai.reset(token)
+            await client.close()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after,
+        retry=retry_if_exception_type((openai.RateLimitError, openai.APIError)),
+    )
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        response_format: Optional[Dict] = None,
+        model: Optional[str] = None,
+        semantic: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """
+        generate()'in asenkron hali. session() bloğu içinde çağrılmalıdır.
+
+        Args:
+            prompt: Gönderilecek prompt metni
+            max_tokens: Max çıktı token sayısı
+            response_format: Örn. JSON_MODE → model sadece geçerli JSON döndürür
+            model: Bu istek için model (None → self.model)
+            semantic: (prompt türü, yorum metni) — verilirse semantic cache'te aranır;
+                None → sadece birebir önbellek (final / direct özetler ürüne özeldir)
+
+        Returns:
+            Yapay zeka yanıtı (string)
+        """
+        client = _async_openai.get()
+        if client is None:
+            raise RuntimeError("agenerate() bir `async with llm.session():` bloğu içinde çağrılmalı.")
+
+        model = model or self.model
+        cached = self.cached(prompt, max_tokens, model, semantic)
+        if cached is not None:
+            return cached
+
+        await self.bucket.aacquire(1, estimate_tokens(model, prompt) + max_tokens)
+
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=0.7,
+                **({"response_format": response_format} if response_format else {}),
+            )
+
+            # İstatistik güncelle
+            self.add_usage(response.usage.total_tokens if response.usage else 0)
+
+            content = response.choices[0].message.content
+            logger.debug(f"Yanıt geldi: {len(content)} karakter")
+
+            self.remember(prompt, max_tokens, model, content, semantic)
+            return content
+
+        except openai.RateLimitError:
+            logger.warning("Rate limit (429) alındı, tekrar denenecek...")
+            raise  # retry decorator tekrar deneyecek
+
+        except openai.APIError as e:
+            logger.error(f"API hata: {e}")
+            raise
 
 
 # ─────────────────────────────────────────
@@ -174,6 +428,26 @@ Yorumlar:
 Özet:"""
 
 
+BATCH_CHUNK_PROMPT = """Aşağıda aynı ürüne ait {count} ayrı kullanıcı yorumu grubu bulunmaktadır.
+Gruplar [G1], [G2] ... şeklinde etiketlenmiştir.
+Her grup için AYRI ayrı kısa ve objektif bir özet çıkar.
+
+Her özette şu konulara değin:
+- Genel değerlendirme
+- Olumlu yönler
+- Olumsuz yönler
+- Fiyat / performans
+- Paketleme kalitesi
+- Kargo hızı
+
+SADECE aşağıdaki JSON formatında yanıt ver, başka hiçbir şey yazma:
+{{{keys}}}
+
+Yorum grupları:
+{groups}
+"""
+
+
 FINAL_PROMPT = """Aşağıda bir ürün hakkında farklı yorum gruplarından çıkarılmış özetler var.
 Bu özetleri birleştirerek tek bir kapsamlı değerlendirme oluştur.
 
@@ -193,6 +467,97 @@ SADECE aşağıdaki JSON formatında yanıt ver, başka hiçbey şey yazma:
 """
 
 
+DIRECT_PROMPT = """Aşağıda bir ürüne ait kullanıcı yorumları bulunmaktadır.
+Bu yorumlara dayanarak kısa, objektif ve kapsamlı bir değerlendirme oluştur.
+
+SADECE aşağıdaki JSON formatında yanıt ver, başka hiçbir şey yazma:
+{{
+  "overall_summary": "...",
+  "positive_aspects": ["...", "..."],
+  "negative_aspects": ["...", "..."],
+  "price_performance": "...",
+  "packaging_quality": "...",
+  "shipping_speed": "...",
+  "sentiment": "Olumlu veya Nötr veya Olumsuz"
+}}
+
+Yorumlar:
+{reviews}
+"""
+
+
+# JSON isteyen prompt'lar için: model markdown blok / ek açıklama yazamaz
+JSON_MODE = {"type": "json_object"}
+
+# FINAL_PROMPT / DIRECT_PROMPT çıktısının şeması (structured output destekleyen modellerde zorunlu tutulur)
+FINAL_SCHEMA = {
+    "name": "ReviewFinal",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "overall_summary": {"type": "string"},
+            "positive_aspects": {"type": "array", "items": {"type": "string"}},
+            "negative_aspects": {"type": "array", "items": {"type": "string"}},
+            "price_performance": {"type": "string"},
+            "packaging_quality": {"type": "string"},
+            "shipping_speed": {"type": "string"},
+            "sentiment": {"type": "string", "enum": ["Olumlu", "Nötr", "Olumsuz"]},
+        },
+        "required": [
+            "overall_summary", "positive_aspects", "negative_aspects",
+            "price_performance", "packaging_quality", "shipping_speed", "sentiment",
+        ],
+        "additionalProperties": False,
+    },
+}
+
+
+def final_response_format(model: str) -> Dict:
+    """Model json_schema destekliyorsa şemalı, değilse düz JSON modu."""
+    if model.startswith(settings.STRUCTURED_OUTPUT_MODELS):
+        return {"type": "json_schema", "json_schema": FINAL_SCHEMA}
+    return JSON_MODE
+
+
+def _split_template(template: str, field: str) -> tuple:
+    """
+    Şablonu `field` alanının önü ve arkası olarak ikiye ayırır ({{ }} kaçışları çözülür).
+
+    Prompt'lar her seferinde str.format ile parse edilmek yerine
+    "".join((prefix, metin, suffix)) ile tek kopyada kurulur.
+    """
+    marker = "\x00"
+    return tuple(template.format(**{field: marker}).split(marker))
+
+
+_CHUNK_PREFIX, _CHUNK_SUFFIX = _split_template(CHUNK_PROMPT, "reviews")
+_FINAL_PREFIX, _FINAL_SUFFIX = _split_template(FINAL_PROMPT, "summaries")
+_DIRECT_PREFIX, _DIRECT_SUFFIX = _split_template(DIRECT_PROMPT, "reviews")
+# Başlık {count}/{keys} ile küçük bir format alır, yorum grupları formatlanmaz
+_BATCH_HEADER, _BATCH_FOOTER = BATCH_CHUNK_PROMPT.split("{groups}")
+
+
+# En dıştaki {...} bloğu (iki seviyeye kadar iç içe süslü parantez)
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
+
+
+def _parse_json(raw_result: str) -> Dict:
+    """
+    Model yanıtını JSON olarak okur. Hata olursa json.JSONDecodeError fırlatır.
+
+    Yanıt doğrudan parse edilemezse (markdown blok, önünde/arkasında açıklama)
+    metindeki ilk JSON nesnesi aranır.
+    """
+    try:
+        return _json_loads(raw_result)
+    except json.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(raw_result)
+        if match is None:
+            raise
+        return _json_loads(match.group(0))
+
+
 # ─────────────────────────────────────────
 # REVIEW SUMMARIZER
 # ─────────────────────────────────────────
@@ -202,15 +567,38 @@ class ReviewSummarizer:
     Ürün yorumlarını AI ile özetleyen sınıf.
 
     Nasıl çalışır:
-    1. Yorumları chunk_size'luk gruplara ayırır
-    2. Her grubu ayrıca özetletir (CHUNK_PROMPT)
+    0. Tekrar eden / çok benzer yorumları teke indirir (sayısıyla birlikte)
+       — yorumlar SINGLE_SHOT_TOKEN_BUDGET'a sığıyorsa tek istekte doğrudan
+         final JSON istenir (DIRECT_PROMPT), 1-3. adımlar atlanır
+    1. Yorumları CHUNK_TOKEN_BUDGET'a sığan (en fazla chunk_size yorumluk) gruplara ayırır
+    2. Grupları özetletir — chunks_per_request kadar chunk tek istekte
+       (BATCH_CHUNK_PROMPT), toplu yanıt okunamazsa tek tek (CHUNK_PROMPT)
+       — AsyncLLMClient verilirse tüm istekler eşzamanlı gönderilir
     3. Tüm özet parçalarını tek bir özete birleştir (FINAL_PROMPT)
     """
 
     def __init__(self, llm_client: LLMClient):
         self.llm = llm_client
         self.chunk_size = settings.CHUNK_SIZE
-        logger.info(f"ReviewSummarizer hazır → chunk_size: {self.chunk_size}")
+        self.chunks_per_request = settings.CHUNKS_PER_REQUEST
+
+        # Çok sayıda kısa chunk özeti ucuz modelle, tek final özet asıl modelle
+        self.chunk_model = settings.AI_MODEL_CHUNK
+        self.final_model = settings.AI_MODEL_FINAL
+
+        # Chunk prompt'unun yorumlar hariç token maliyeti (bir kez hesaplanır)
+        self.token_budget = settings.CHUNK_TOKEN_BUDGET
+        self._prompt_overhead = estimate_tokens(self.chunk_model, _CHUNK_PREFIX + _CHUNK_SUFFIX)
+
+        # Bu bütçeye sığan ürünler chunk'lanmadan tek istekle özetlenir
+        self.single_shot_budget = settings.SINGLE_SHOT_TOKEN_BUDGET
+        self._direct_overhead = estimate_tokens(self.final_model, _DIRECT_PREFIX + _DIRECT_SUFFIX)
+
+        logger.info(
+            f"ReviewSummarizer hazır → chunk_size: {self.chunk_size} | "
+            f"chunks_per_request: {self.chunks_per_request} | "
+            f"model: {self.chunk_model} / {self.final_model}"
+        )
 
     def summarize(
         self, product_id: str, reviews: List[str]
@@ -232,8 +620,20 @@ class ReviewSummarizer:
         logger.info(f"[{product_id}] {len(reviews)} yorum analiz ediliyor...")
 
         try:
+            # Step 0: Tekrar eden yorumları ayıkla
+            unique_reviews = self.prepare_reviews(reviews)
+
+            # Kısa yorum setleri: tek istek, doğrudan final JSON
+            if self.fits_single_shot(unique_reviews):
+                logger.debug(f"  [{product_id}] tek istekte özetleniyor")
+                final = self._generate_direct_summary(unique_reviews)
+                return self._build_summary(product_id, final, len(reviews))
+
             # Step 1: Chunk'lara ayır ve her birini özetle
-            chunk_summaries = self._process_chunks(reviews)
+            if isinstance(self.llm, AsyncLLMClient):
+                chunk_summaries = asyncio.run(self._process_chunks_async(unique_reviews))
+            else:
+                chunk_summaries = self._process_chunks(unique_reviews)
 
             if not chunk_summaries:
                 return self._empty_summary(product_id)
@@ -241,67 +641,263 @@ class ReviewSummarizer:
             # Step 2: Tüm özet parçalarını birleştir
             final = self._generate_final_summary(chunk_summaries)
 
-            return ReviewSummary(
-                product_id=product_id,
-                overall_summary=final.get("overall_summary", ""),
-                positive_aspects=final.get("positive_aspects", []),
-                negative_aspects=final.get("negative_aspects", []),
-                price_performance=final.get("price_performance", ""),
-                packaging_quality=final.get("packaging_quality", ""),
-                shipping_speed=final.get("shipping_speed", ""),
-                sentiment=final.get("sentiment", "Nötr"),
-                reviews_analyzed=len(reviews),
-            )
+            return self._build_summary(product_id, final, len(reviews))
 
         except Exception as e:
             logger.error(f"[{product_id}] Özet üretim hatası: {e}", exc_info=True)
             return self._error_summary(product_id, str(e))
 
+    # ── Ön işleme ──
+    def prepare_reviews(self, reviews: List[str]) -> List[str]:
+        """
+        Birebir / çok benzer yorumlardan sadece ilkini bırakır.
+
+        Birden çok kez geçen yorumların başına kaç kullanıcının benzer şekilde
+        yazdığı eklenir; böylece model hangi görüşün yaygın olduğunu yine görür.
+        """
+        if not settings.DEDUP_REVIEWS:
+            return reviews
+
+        groups = group_near_duplicates(reviews, threshold=settings.DEDUP_THRESHOLD)
+        if len(groups) < len(reviews):
+            logger.debug(f"  {len(reviews)} yorum → {len(groups)} benzersiz yorum")
+
+        return [
+            reviews[idx] if count == 1 else f"({count} kullanıcı benzer şekilde) {reviews[idx]}"
+            for idx, count in groups
+        ]
+
+    def fits_single_shot(self, reviews: List[str]) -> bool:
+        """Yorumların tamamı DIRECT_PROMPT ile single_shot_budget'a sığıyor mu?"""
+        budget = self.single_shot_budget - self._direct_overhead
+        used = 0
+        for review in reviews:
+            used += estimate_tokens(self.final_model, review) + 1  # +1: ayraç "\n"
+            if used > budget:
+                return False
+        return used > 0
+
     # ── Chunk işleme ──
+    def _split_chunks(self, reviews: List[str]) -> List[List[str]]:
+        """
+        Yorumları token bütçesine göre chunk'lara paketler (greedy).
+
+        Chunk, prompt ile birlikte token_budget'ı aşacaksa veya chunk_size yoruma
+        ulaştıysa yeni chunk açılır. Tek başına bütçeyi aşan yorum kısaltılır.
+        """
+        budget = max(self.token_budget - self._prompt_overhead, 1)
+
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        used = 0
+
+        for review in reviews:
+            tokens = estimate_tokens(self.chunk_model, review) + 1  # +1: ayraç "\n"
+            if tokens > budget:
+                review = truncate_tokens(self.chunk_model, review, budget - 1)
+                tokens = budget
+
+            if current and (used + tokens > budget or len(current) >= self.chunk_size):
+                chunks.append(current)
+                current, used = [], 0
+
+            current.append(review)
+            used += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _group_chunks(self, chunks: List[List[str]]) -> List[List[List[str]]]:
+        """Chunk'ları chunks_per_request'lik istek gruplarına ayırır."""
+        k = self.chunks_per_request
+        return [chunks[i : i + k] for i in range(0, len(chunks), k)]
+
+    @staticmethod
+    def _chunk_prompt(chunk: List[str]) -> str:
+        return "".join((_CHUNK_PREFIX, "\n".join(chunk), _CHUNK_SUFFIX))
+
+    @staticmethod
+    def _batch_prompt(group: List[List[str]]) -> str:
+        """Birden fazla chunk'ı [G1]..[Gk] etiketleriyle tek prompt'ta toplar."""
+        keys = ", ".join(f'"G{i}": "..."' for i in range(1, len(group) + 1))
+        groups = "\n\n".join(
+            f"[G{i}]\n" + "\n".join(chunk) for i, chunk in enumerate(group, 1)
+        )
+        header = _BATCH_HEADER.format(count=len(group), keys=keys)
+        return "".join((header, groups, _BATCH_FOOTER))
+
+    @staticmethod
+    def _chunk_semantic(chunk: List[str]) -> Tuple[str, str]:
+        """Semantic cache anahtarı: sadece yorumlar (şablon embed edilmez)."""
+        return "chunk", "\n".join(chunk)
+
+    @staticmethod
+    def _batch_semantic(group: List[List[str]]) -> Tuple[str, str]:
+        """Toplu istekte yanıt G1..Gk içerir → aynı k'lı isteklerle karşılaştırılır."""
+        return f"batch{len(group)}", "\n\n".join("\n".join(chunk) for chunk in group)
+
+    @staticmethod
+    def _parse_batch(raw_result: str, count: int) -> Optional[List[str]]:
+        """Toplu yanıttaki G1..Gk özetlerini sırayla döndürür; eksik/bozuksa None."""
+        try:
+            data = _parse_json(raw_result)
+            return [str(data[f"G{i}"]) for i in range(1, count + 1)]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
     def _process_chunks(self, reviews: List[str]) -> List[str]:
-        """Yorumları gruplara ayırır, her grubu ayrıca özetler."""
-        chunks = [
-            reviews[i : i + self.chunk_size]
-            for i in range(0, len(reviews), self.chunk_size)
-        ]
+        """Yorumları gruplara ayırır, grupları sırayla (istek başına birkaç chunk) özetler."""
+        groups = self._group_chunks(self._split_chunks(reviews))
 
         summaries = []
-        for idx, chunk in enumerate(chunks, 1):
+        for idx, group in enumerate(groups, 1):
             try:
-                review_text = "\n".join(chunk)
-                prompt = CHUNK_PROMPT.format(reviews=review_text)
-
-                result = self.llm.generate(prompt=prompt, max_tokens=500)
-                summaries.append(result)
-
-                logger.debug(f"  Chunk {idx}/{len(chunks)} tamamlandı")
-                time.sleep(1.5)  # Rate limit koruma
+                if len(group) > 1:
+                    raw = self.llm.generate(
+                        prompt=self._batch_prompt(group),
+                        max_tokens=500 * len(group),
+                        response_format=JSON_MODE,
+                        model=self.chunk_model,
+                        semantic=self._batch_semantic(group),
+                    )
+                    batch = self._parse_batch(raw, len(group))
+                    if batch is not None:
+                        summaries.extend(batch)
+                        logger.debug(f"  İstek {idx}/{len(groups)} tamamlandı ({len(group)} chunk)")
+                        continue
+                    logger.warning(f"  İstek {idx}: toplu yanıt okunamadı, chunk'lar tek tek gönderiliyor")
+
+                for chunk in group:
+                    summaries.append(self.llm.generate(
+                        prompt=self._chunk_prompt(chunk),
+                        max_tokens=500,
+                        model=self.chunk_model,
+                        semantic=self._chunk_semantic(chunk),
+                    ))
+                logger.debug(f"  İstek {idx}/{len(groups)} tamamlandı")
 
             except Exception as e:
-                logger.warning(f"  Chunk {idx} başarısız: {e}")
+                logger.warning(f"  İstek {idx} başarısız: {e}")
                 continue
 
         return summaries
 
+    async def _process_chunks_async(self, reviews: List[str]) -> List[str]:
+        """
+        Tüm istek gruplarını aynı anda özetletir.
+
+        En fazla llm.max_concurrency istek aynı anda açıktır (Semaphore).
+        Sonuçlar chunk sırasıyla döner; başarısız gruplar atlanır.
+        """
+        groups = self._group_chunks(self._split_chunks(reviews))
+        semaphore = asyncio.Semaphore(self.llm.max_concurrency)
+
+        async def limited(
+            prompt: str,
+            max_tokens: int,
+            semantic: Tuple[str, str],
+            response_format: Optional[Dict] = None,
+        ) -> str:
+            async with semaphore:
+                return await self.llm.agenerate(
+                    prompt=prompt,
+                    max_tokens=max_tokens,
+                    response_format=response_format,
+                    model=self.chunk_model,
+                    semantic=semantic,
+                )
+
+        async def summarize_group(idx: int, group: List[List[str]]) -> List[str]:
+            try:
+                if len(group) > 1:
+                    raw = await limited(
+                        self._batch_prompt(group),
+                        500 * len(group),
+                        self._batch_semantic(group),
+                        JSON_MODE,
+                    )
+                    batch = self._parse_batch(raw, len(group))
+                    if batch is not None:
+                        logger.debug(f"  İstek {idx}/{len(groups)} tamamlandı ({len(group)} chunk)")
+                        return batch
+                    logger.warning(f"  İstek {idx}: toplu yanıt okunamadı, chunk'lar tek tek gönderiliyor")
+
+                results = await asyncio.gather(
+                    *(
+                        limited(self._chunk_prompt(chunk), 500, self._chunk_semantic(chunk))
+                        for chunk in group
+                    )
+                )
+                logger.debug(f"  İstek {idx}/{len(groups)} tamamlandı")
+                return list(results)
+
+            except Exception as e:
+                logger.warning(f"  İstek {idx} başarısız: {e}")
+                return []
+
+        async with self.llm.session():
+            results = await asyncio.gather(
+                *(summarize_group(idx, group) for idx, group in enumerate(groups, 1))
+            )
+
+        return [summary for batch in results for summary in batch]
+
+    # ── Offline (Batch API) ──
+    def chunk_prompts(self, reviews: List[str]) -> List[str]:
+        """prepare_reviews() çıktısını chunk'lara ayırıp her chunk için bir CHUNK_PROMPT döndürür."""
+        return [self._chunk_prompt(chunk) for chunk in self._split_chunks(reviews)]
+
+    def summary_from_response(
+        self, product_id: str, raw_result: Optional[str], reviews_analyzed: int
+    ) -> ReviewSummary:
+        """
+        Dışarıda (Batch API) alınmış final / direct yanıtını ReviewSummary'ye çevirir.
+
+        reviews_analyzed 0 → boş özet, raw_result None (yanıt yok) → hata özeti.
+        """
+        if not reviews_analyzed:
+            return self._empty_summary(product_id)
+        if raw_result is None:
+            return self._error_summary(product_id, "Batch yanıtı yok")
+        return self._build_summary(product_id, self._parse_final(raw_result), reviews_analyzed)
+
     # ── Final özet ──
     def _generate_final_summary(self, chunk_summaries: List[str]) -> Dict:
         """Tüm chunk özetlerini tek JSON'a birleştir."""
-        summaries_text = "\n\n---\n\n".join(chunk_summaries)
-        prompt = FINAL_PROMPT.format(summaries=summaries_text)
+        return self._request_final(self.final_prompt(chunk_summaries))
+
+    def _generate_direct_summary(self, reviews: List[str]) -> Dict:
+        """Yorumların kendisinden (chunk özeti olmadan) final JSON üret."""
+        return self._request_final(self.direct_prompt(reviews))
+
+    def _request_final(self, prompt: str) -> Dict:
+        raw_result = self.llm.generate(
+            prompt=prompt,
+            max_tokens=800,
+            response_format=final_response_format(self.final_model),
+            model=self.final_model,
+        )
+        return self._parse_final(raw_result)
+
+    @staticmethod
+    def final_prompt(chunk_summaries: List[str]) -> str:
+        return "".join((_FINAL_PREFIX, "\n\n---\n\n".join(chunk_summaries), _FINAL_SUFFIX))
 
-        raw_result = self.llm.generate(prompt=prompt, max_tokens=800)
+    @staticmethod
+    def direct_prompt(reviews: List[str]) -> str:
+        return "".join((_DIRECT_PREFIX, "\n".join(reviews), _DIRECT_SUFFIX))
 
+    @staticmethod
+    def _parse_final(raw_result: str) -> Dict:
+        """
+        Final yanıtı dict'e çevirir; JSON değilse raw text'li bir dict döner.
+
+        Şemalı çıktıda da yanıt max_tokens'ta kesilebildiği için fallback korunur.
+        """
         # JSON parse et
         try:
-            # Eğer markdown code block içindeyse temizle
-            cleaned = raw_result.strip()
-            if cleaned.startswith("```"):
-                cleaned = cleaned.split("```")[1]
-                if cleaned.startswith("json"):
-                    cleaned = cleaned[4:]
-            cleaned = cleaned.strip()
-
-            return json.loads(cleaned)
+            return _parse_json(raw_result)
 
         except json.JSONDecodeError:
             # JSON parse başarısız olursa raw text döndür
@@ -316,6 +912,20 @@ class ReviewSummarizer:
                 "sentiment": "Nötr",
             }
 
+    @staticmethod
+    def _build_summary(product_id: str, final: Dict, reviews_analyzed: int) -> ReviewSummary:
+        return ReviewSummary(
+            product_id=product_id,
+            overall_summary=final.get("overall_summary", ""),
+            positive_aspects=final.get("positive_aspects", []),
+            negative_aspects=final.get("negative_aspects", []),
+            price_performance=final.get("price_performance", ""),
+            packaging_quality=final.get("packaging_quality", ""),
+            shipping_speed=final.get("shipping_speed", ""),
+            sentiment=final.get("sentiment", "Nötr"),
+            reviews_analyzed=reviews_analyzed,
+        )
+
     # ── Boş/Hata özetleri ──
     def _empty_summary(self, product_id: str) -> ReviewSummary:
         return ReviewSummary(
@@ -351,6 +961,7 @@ class ReviewSummarizer:
 def run_ai_analysis(
     reviews_csv: str = None,
     output_csv: str = None,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """
     CSV'deki yorumları oku, AI özet üret, sonuçları kaydet.
@@ -358,6 +969,7 @@ def run_ai_analysis(
     Args:
         reviews_csv: Yorum CSV dosyası yolu
         output_csv: Özet CSV dosyası yolu
+        use_cache: False → önbellek kullanılmaz, tüm özetler yeniden üretilir
 
     Returns:
         Özet DataFrame
@@ -369,34 +981,79 @@ def run_ai_analysis(
 
     logger.info(f"📂 Yorumlar okunuyor: {reviews_csv}")
 
-    # CSV oku
-    df = pd.read_csv(reviews_csv)
-    grouped = df.groupby("product_id")["review"].apply(list)
-
-    # AI components
-    llm = LLMClient()
-    summarizer = ReviewSummarizer(llm)
+    # Ürünler tek tek okunur; tüm yorumlar hiçbir zaman birlikte bellekte tutulmaz
+    grouped = iter_grouped_reviews(reviews_csv)
 
     # Her ürün için özet üret
     results = []
-    total = len(grouped)
 
-    for idx, (product_id, review_list) in enumerate(grouped.items(), 1):
-        logger.info(f"[{idx}/{total}] {product_id} işleniyor...")
+    # Sonuçlar üretildikçe CSV'ye yazılır (yarıda kesilirse bitenler kaybolmaz)
+    with open(output_csv, "w", newline="", encoding="utf-8") as out_file:
+        writer = csv.DictWriter(out_file, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
 
-        summary = summarizer.summarize(product_id, review_list)
-        results.append(summary.to_dict())
+        def save(summary: ReviewSummary) -> None:
+            row = summary.to_dict()
+            writer.writerow(row)
+            out_file.flush()
+            results.append(row)
 
-    # Sonuçları kaydet
-    result_df = pd.DataFrame(results)
-    result_df.to_csv(output_csv, index=False)
+        _summarize_all(grouped, save, use_cache)
 
+    result_df = pd.DataFrame(results, columns=SUMMARY_COLUMNS)
     logger.info(f"💾 Özetler kaydedildi: {output_csv}")
-    logger.info(f"📊 API kullanım: {llm.get_usage_stats()}")
 
     return result_df
 
 
+def _summarize_all(
+    grouped: Iterable[Tuple[str, List[str]]],
+    save: Callable[[ReviewSummary], None],
+    use_cache: bool,
+) -> None:
+    """(product_id, yorumlar) çiftlerindeki tüm ürünleri özetler, her özeti save() ile hemen kaydeder."""
+
+    if settings.USE_BATCH_API:
+        # Offline mod: tüm prompt'lar Batch API ile gönderilir (%50 ucuz, 24 saat içinde)
+        from src.ai_analysis.batch_runner import BatchRunner
+
+        with LLMClient(use_cache=use_cache) as llm:
+            summarizer = ReviewSummarizer(llm)
+            summaries = BatchRunner(summarizer).run(grouped)
+            logger.info(f"📦 Batch API modu → {len(summaries)} ürün")
+
+            for summary in summaries:
+                save(summary)
+
+    else:
+        # AI components
+        with AsyncLLMClient(use_cache=use_cache) as llm:
+            summarizer = ReviewSummarizer(llm)
+
+            # Her thread kendi event loop'unda summarize() çalıştırır; rate limit ortak bucket'ta.
+            # Sonuçlar gönderim sırasıyla yazılır (aynı girdi → aynı CSV); bitmiş ama sırası
+            # gelmemiş sonuçlar için kuyruk en fazla 2 × PRODUCT_CONCURRENCY ürün tutar.
+            window = 2 * settings.PRODUCT_CONCURRENCY
+            with ThreadPoolExecutor(max_workers=settings.PRODUCT_CONCURRENCY) as executor:
+                pending: Deque[Tuple[str, Future]] = deque()
+                idx = 0
+
+                def drain(limit: int) -> None:
+                    nonlocal idx
+                    while len(pending) > limit:
+                        product_id, future = pending.popleft()
+                        idx += 1
+                        save(future.result())
+                        logger.info(f"[{idx}] {product_id} tamamlandı")
+
+                for product_id, review_list in grouped:
+                    pending.append((product_id, executor.submit(summarizer.summarize, product_id, review_list)))
+                    drain(window)
+                drain(0)
+
+    logger.info(f"📊 API kullanım: {llm.get_usage_stats()}")
+
+
 # ─────────────────────────────────────────
 # ÇALIŞTIRMA
 # ─────────────────────────────────────────
@@ -407,6 +1064,13 @@ if __name__ == "__main__":
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    parser = argparse.ArgumentParser(description="Yorumlardan AI özet üretir.")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Önbelleği atla, tüm özetleri yeniden üret",
+    )
+    args = parser.parse_args()
+
     print("🤖 AI Analysis başlıyor...\n")
-    result = run_ai_analysis()
+    result = run_ai_analysis(use_cache=not args.no_cache)
     print(f"\n✅ Tamamlandı! {len(result)} ürün analiz edildi.")
\ No newline at end of file
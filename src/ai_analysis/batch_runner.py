@@ -0,0 +1,282 @@
+"""
+src/ai_analysis/batch_runner.py
+
+OpenAI Batch API ile offline yorum analizi.
+- Tüm chunk prompt'ları JSONL dosyalarında toplanır ve batch olarak gönderilir (1. aşama)
+- Chunk özetleri gelince final prompt'lar ayrı batch'lerle gönderilir (2. aşama)
+- Batch istekleri senkron API'nin yarı fiyatına, ayrı bir rate limit havuzundan işlenir
+  (sonuçlar 24 saat içinde döner — dashboard için değil, toplu analiz için)
+- Her aşama Batch API dosya limitlerine göre (MAX_BATCH_REQUESTS / MAX_BATCH_BYTES)
+  gerektiği kadar dosyaya ve batch'e bölünür
+- Başarısız / süresi dolan batch'lerin tamamlanan satırları yine kullanılır
+"""
+
+import json
+import time
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.config.config_settings import settings
+from src.ai_analysis.ai_analysis import ReviewSummarizer, ReviewSummary, final_response_format
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# SABİTLER
+# ─────────────────────────────────────────
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Batch API girdi dosyası limitleri (boyutta küçük bir pay bırakılır)
+MAX_BATCH_REQUESTS = 50_000
+MAX_BATCH_BYTES = 190 * 1024 * 1024
+
+
+# ─────────────────────────────────────────
+# BATCH RUNNER
+# ─────────────────────────────────────────
+
+class BatchRunner:
+    """
+    ReviewSummarizer'ın prompt'larını Batch API üzerinden çalıştırır.
+
+    Akış:
+    0. Önbellekte yanıtı olan prompt'lar gönderilmez, gelen yanıtlar önbelleğe yazılır
+    1. Her ürünün her chunk'ı için bir istek → batch #1 (custom_id: "<ürün>:chunk:<i>")
+       (tek isteğe sığan ürünler bu adımı atlar)
+    2. Chunk özetleri ürün bazında toplanır → batch #2 (custom_id: "<ürün>:final")
+    3. Final yanıtları ReviewSummary'ye çevrilir
+    """
+
+    def __init__(
+        self,
+        summarizer: ReviewSummarizer,
+        poll_interval: int = settings.BATCH_POLL_INTERVAL,
+    ):
+        self.summarizer = summarizer
+        self.llm = summarizer.llm
+        self.client = summarizer.llm.client
+        self.poll_interval = poll_interval
+
+    def run(self, grouped: Iterable[Tuple[str, List[str]]]) -> List[ReviewSummary]:
+        """
+        Tüm ürünleri iki aşamada (chunk → final) batch ile özetler.
+
+        Args:
+            grouped: (product_id, [yorum, ...]) çiftleri (dict.items() veya iter_grouped_reviews)
+
+        Returns:
+            Girdi sırasıyla ReviewSummary listesi
+        """
+        summarizer = self.summarizer
+        review_counts: Dict[str, int] = {}
+        chunk_prompts: Dict[str, List[str]] = {}
+        direct_prompts: Dict[str, str] = {}
+
+        # Yorumlar ürün ürün prompt'a çevrilir; ham yorum listeleri tutulmaz.
+        # Bütçeye sığan ürünler chunk batch'ine girmez, doğrudan final batch'e gider
+        for product_id, reviews in grouped:
+            review_counts[product_id] = len(reviews)
+            if not reviews:
+                continue
+
+            unique_reviews = summarizer.prepare_reviews(reviews)
+            if summarizer.fits_single_shot(unique_reviews):
+                direct_prompts[product_id] = summarizer.direct_prompt(unique_reviews)
+            else:
+                chunk_prompts[product_id] = summarizer.chunk_prompts(unique_reviews)
+
+        # Step 1: Chunk özetleri
+        chunk_requests = {
+            f"{product_id}:chunk:{i}": (prompt, 500, None)
+            for product_id, prompts in chunk_prompts.items()
+            for i, prompt in enumerate(prompts)
+        }
+        chunk_results = self._run_cached(chunk_requests, stage="chunk", model=summarizer.chunk_model)
+
+        chunk_summaries: Dict[str, List[str]] = defaultdict(list)
+        for custom_id in chunk_requests:  # istek sırası = chunk sırası
+            if custom_id in chunk_results:
+                product_id = custom_id.rsplit(":chunk:", 1)[0]
+                chunk_summaries[product_id].append(chunk_results[custom_id])
+
+        # Step 2: Final özetler
+        final_model = summarizer.final_model
+        final_format = final_response_format(final_model)
+        final_requests = {
+            f"{product_id}:final": (summarizer.final_prompt(summaries), 800, final_format)
+            for product_id, summaries in chunk_summaries.items()
+        }
+        final_requests.update({
+            f"{product_id}:final": (prompt, 800, final_format)
+            for product_id, prompt in direct_prompts.items()
+        })
+        final_results = self._run_cached(final_requests, stage="final", model=final_model)
+
+        # Step 3: ReviewSummary'lere çevir
+        return [
+            summarizer.summary_from_response(
+                product_id, final_results.get(f"{product_id}:final"), review_count
+            )
+            for product_id, review_count in review_counts.items()
+        ]
+
+    # ── Önbellek ──
+    def _run_cached(self, requests: Dict[str, tuple], stage: str, model: str) -> Dict[str, str]:
+        """
+        _run_batch'in prompt önbellekli hali.
+
+        Önbellekte yanıtı olan istekler batch'e hiç girmez; batch'ten dönen yanıtlar
+        önbelleğe yazılır (senkron mod ile aynı anahtarlar, use_cache=False → önbellek yok).
+        """
+        results: Dict[str, str] = {}
+        missing: Dict[str, tuple] = {}
+        for custom_id, (prompt, max_tokens, response_format) in requests.items():
+            cached = self.llm.cached(prompt, max_tokens, model)
+            if cached is not None:
+                results[custom_id] = cached
+            else:
+                missing[custom_id] = (prompt, max_tokens, response_format)
+
+        if results:
+            logger.info(f"♻️ [{stage}] {len(results)}/{len(requests)} istek önbellekten geldi")
+        if not missing:
+            return results
+
+        fetched = self._run_batch(missing, stage=stage, model=model)
+        for custom_id, content in fetched.items():
+            prompt, max_tokens, _ = missing[custom_id]
+            self.llm.remember(prompt, max_tokens, model, content)
+
+        results.update(fetched)
+        return results
+
+    # ── Batch yaşam döngüsü ──
+    def _run_batch(self, requests: Dict[str, tuple], stage: str, model: str) -> Dict[str, str]:
+        """
+        İstekleri limitlere göre JSONL dosyalarına böler, hepsini gönderir, bitene kadar bekler.
+
+        Args:
+            requests: {custom_id: (prompt, max_tokens, response_format)}
+            stage: Dosya adı / log için aşama adı ("chunk" veya "final")
+            model: Bu batch'teki tüm isteklerin modeli
+
+        Returns:
+            {custom_id: yanıt metni} — hatalı satırlar ve tamamlanamayan batch'lerin
+            işlenmemiş satırları atlanır (o ürünler hata özeti alır)
+        """
+        # Tüm parçalar önce gönderilir, sonra beklenir (parçalar paralel işlenir)
+        batch_ids = []
+        for shard, input_path in enumerate(self._write_jsonl(requests, stage, model), 1):
+            with open(input_path, "rb") as f:
+                input_file = self.client.files.create(file=f, purpose="batch")
+
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+            logger.info(f"📦 Batch gönderildi [{stage} #{shard}] → {batch.id}")
+            batch_ids.append(batch.id)
+
+        results: Dict[str, str] = {}
+        for batch_id in batch_ids:
+            batch = self._wait(batch_id)
+            if batch.status != "completed":
+                logger.warning(f"⚠️ Batch {batch.id} tamamlanamadı: {batch.status}")
+
+            # Süresi dolan / iptal edilen batch'lerde de biten satırlar output dosyasındadır
+            if batch.output_file_id:
+                results.update(self._parse_output(self.client.files.content(batch.output_file_id).text))
+            if batch.error_file_id:
+                errors = self.client.files.content(batch.error_file_id).text
+                failed = sum(1 for line in errors.splitlines() if line.strip())
+                logger.warning(f"⚠️ Batch {batch.id}: {failed} istek hata verdi")
+
+        missing = len(requests) - sum(custom_id in results for custom_id in requests)
+        if missing:
+            logger.warning(f"⚠️ [{stage}] {missing}/{len(requests)} istek yanıtsız kaldı")
+        return results
+
+    def _write_jsonl(self, requests: Dict[str, tuple], stage: str, model: str) -> List[Path]:
+        """
+        Batch API'nin beklediği formatta JSONL dosyaları yazar.
+
+        Dosya MAX_BATCH_REQUESTS satıra veya MAX_BATCH_BYTES boyuta ulaşınca yenisi açılır.
+        """
+        paths: List[Path] = []
+        timestamp = int(time.time())
+        f = None
+        count = size = 0
+
+        try:
+            for line in self._jsonl_lines(requests, model):
+                data = line.encode("utf-8")
+                if f is None or count >= MAX_BATCH_REQUESTS or size + len(data) > MAX_BATCH_BYTES:
+                    if f is not None:
+                        f.close()
+                    path = settings.BATCH_DIR / f"batch_{stage}_{timestamp}_{len(paths) + 1}.jsonl"
+                    paths.append(path)
+                    f = open(path, "wb")
+                    count = size = 0
+
+                f.write(data)
+                count += 1
+                size += len(data)
+        finally:
+            if f is not None:
+                f.close()
+
+        logger.debug(f"Batch dosyaları yazıldı: {[str(path) for path in paths]}")
+        return paths
+
+    @staticmethod
+    def _jsonl_lines(requests: Dict[str, tuple], model: str) -> Iterator[str]:
+        for custom_id, (prompt, max_tokens, response_format) in requests.items():
+            body = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens,
+                "temperature": 0.7,
+            }
+            if response_format:
+                body["response_format"] = response_format
+
+            line = {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    def _wait(self, batch_id: str):
+        """Batch terminal bir duruma gelene kadar poll_interval'de bir kontrol eder."""
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+
+            logger.info(f"⏳ Batch {batch_id}: {batch.status}")
+            time.sleep(self.poll_interval)
+
+    def _parse_output(self, output: str) -> Dict[str, str]:
+        """Çıktı JSONL'ini okur, kullanım istatistiklerini günceller."""
+        results = {}
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Batch isteği başarısız: {item.get('custom_id')}")
+                continue
+
+            body = response["body"]
+            results[item["custom_id"]] = body["choices"][0]["message"]["content"]
+
+            self.llm.add_usage((body.get("usage") or {}).get("total_tokens", 0))
+
+        return results
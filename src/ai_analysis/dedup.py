@@ -0,0 +1,115 @@
+"""
+src/ai_analysis/dedup.py
+
+Yorumlarda (neredeyse) tekrar edenleri bulma.
+- Birebir aynı yorumlar normalize edilmiş metinle tek adımda birleştirilir
+- Benzer yorumlar MinHash imzası + LSH bantlarıyla bulunur
+  ("ürün çok güzel, kargo hızlıydı" / "ürün çok güzel kargo da hızlıydı")
+- Her benzer grubun ilk yorumu temsilci olur, grup büyüklüğü sayılır
+"""
+
+import re
+import zlib
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+# ─────────────────────────────────────────
+# SABİTLER
+# ─────────────────────────────────────────
+
+SHINGLE_SIZE = 4  # Karakter n-gram uzunluğu
+NUM_PERM = 64  # MinHash imza uzunluğu
+LSH_BANDS = 8  # 8 bant × 8 satır → eşik ≈ (1/8)^(1/8) ≈ 0.77
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)  # a*x çarpımı uint64'e sığsın diye 2^31-1
+_rng = np.random.default_rng(42)  # sabit tohum → aynı yorumlar her çalıştırmada aynı gruplanır
+_PERM_A = _rng.integers(1, _MERSENNE_PRIME, NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_PRIME, NUM_PERM, dtype=np.uint64)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# ─────────────────────────────────────────
+# MINHASH
+# ─────────────────────────────────────────
+
+def _normalize(text: str) -> str:
+    """Küçük harf, noktalama yok, tek boşluk: "Süper ürün!!" == "süper  ürün"."""
+    return _WHITESPACE_RE.sub(" ", _PUNCTUATION_RE.sub("", text.lower())).strip()
+
+
+def _signature(text: str) -> np.ndarray:
+    """Metnin karakter 4-gram kümesinden MinHash imzası (NUM_PERM uzunluğunda)."""
+    if len(text) <= SHINGLE_SIZE:
+        shingles = {text}
+    else:
+        shingles = {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+    # crc32: Python hash()'inden farklı olarak süreçler arası sabit
+    x = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+    ) % _MERSENNE_PRIME
+    return ((_PERM_A[:, None] * x[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME).min(axis=1)
+
+
+# ─────────────────────────────────────────
+# GRUPLAMA
+# ─────────────────────────────────────────
+
+def group_near_duplicates(
+    texts: List[str],
+    threshold: float = 0.8,
+) -> List[Tuple[int, int]]:
+    """
+    Benzer metinleri gruplar.
+
+    Args:
+        texts: Yorumlar
+        threshold: Tahmini Jaccard benzerliği bu değer ve üstündeyse aynı grup
+
+    Returns:
+        [(temsilci index, grup büyüklüğü), ...] — ilk görülme sırasıyla
+    """
+    rows = NUM_PERM // LSH_BANDS
+
+    counts: Dict[int, int] = {}  # temsilci index → grup büyüklüğü
+    exact: Dict[str, int] = {}  # normalize metin → temsilci index
+    signatures: Dict[int, np.ndarray] = {}
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    for idx, text in enumerate(texts):
+        norm = _normalize(text)
+
+        # Birebir tekrar: imza hesabına gerek yok
+        if norm in exact:
+            counts[exact[norm]] += 1
+            continue
+
+        sig = _signature(norm)
+        keys = [(band, sig[band * rows : (band + 1) * rows].tobytes()) for band in range(LSH_BANDS)]
+
+        # Aynı banda düşen temsilciler aday; imza benzerliği ile doğrula
+        match = None
+        for key in keys:
+            for rep in buckets.get(key, ()):
+                if (signatures[rep] == sig).mean() >= threshold:
+                    match = rep
+                    break
+            if match is not None:
+                break
+
+        if match is not None:
+            counts[match] += 1
+            exact[norm] = match
+            continue
+
+        counts[idx] = 1
+        exact[norm] = idx
+        signatures[idx] = sig
+        for key in keys:
+            buckets.setdefault(key, []).append(idx)
+
+    return list(counts.items())
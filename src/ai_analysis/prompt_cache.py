@@ -0,0 +1,258 @@
+"""
+src/ai_analysis/prompt_cache.py
+
+LLM yanıtları için prompt önbelleği.
+- ExactCache: birebir aynı prompt'a (model + max_tokens + metin) kayıtlı yanıtı döndürür
+- SemanticCache: benzer yorum metinlerine (cosine ≥ eşik) kayıtlı yanıtı döndürür;
+  prompt şablonu değil sadece değişken yorum metni embed edilir, kayıtlar
+  model + prompt türü + max_tokens bölmelerinde ayrı tutulur
+- ExactCache shelve ile, SemanticCache pickle ile diske kaydedilir
+- SemanticCache'in embedding modeli (sentence-transformers) ilk kullanımda yüklenir,
+  kapasite dolunca en eski kullanılan kayıt silinir (LRU)
+"""
+
+import pickle
+import shelve
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config.config_settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# all-MiniLM-L6-v2 256 token'dan sonrasını keser; uzun metin bu boyda parçalara
+# bölünüp parça vektörlerinin ortalaması alınır (sadece ilk yorumlar değil, hepsi sayılır)
+EMBED_SEGMENT_CHARS = 600  # ≈ 200 token (Türkçe, ~3 karakter/token)
+
+SEMANTIC_CACHE_VERSION = 2  # Kayıt formatı değişince eski pickle yok sayılır
+
+
+# ─────────────────────────────────────────
+# EXACT CACHE
+# ─────────────────────────────────────────
+
+class ExactCache:
+    """
+    Hash anahtarlı, diskte kalıcı yanıt önbelleği.
+
+    Aynı CSV ile run_ai_analysis tekrar çalıştırıldığında (veya retry / aynı
+    yorumlar tekrar geldiğinde) prompt'lar API'ye hiç gitmez.
+    """
+
+    def __init__(self, path: Path = settings.LLM_CACHE_FILE):
+        self.path = Path(path)
+        self._db = shelve.open(str(self.path))
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+    @staticmethod
+    def key(model: str, max_tokens: int, prompt: str) -> str:
+        return hashlib.blake2b(f"{model}|{max_tokens}|{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._db.get(key)
+            if value is not None:
+                self.hits += 1
+            return value
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._db[key] = response
+
+    def close(self) -> None:
+        """Bekleyen yazmaları diske işler."""
+        with self._lock:
+            self._db.close()
+
+
+# ─────────────────────────────────────────
+# SEMANTIC CACHE
+# ─────────────────────────────────────────
+
+class SemanticCache:
+    """
+    Embedding benzerliğine dayalı yanıt önbelleği.
+
+    Ürünler arasında "hızlı kargo", "ürün güzel" gibi kalıp yorumlar çok olduğu
+    için chunk'ların bir kısmı neredeyse aynıdır; bunlar API'ye gitmez.
+
+    Sadece chunk özetleri için kullanılır: final / direct özetler ürüne özeldir,
+    başka ürünün özeti benzer görünse bile döndürülmemelidir.
+
+    Kullanımı:
+        cache = SemanticCache()
+        hit = cache.get(yorum_metni, "gpt-4o-mini|chunk|500")
+        if hit is None:
+            cache.put(yorum_metni, "gpt-4o-mini|chunk|500", llm_yaniti)
+        cache.save()
+    """
+
+    def __init__(
+        self,
+        path: Path = settings.SEMANTIC_CACHE_FILE,
+        threshold: float = settings.SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = settings.SEMANTIC_CACHE_MAX_ENTRIES,
+        model_name: str = settings.EMBEDDING_MODEL,
+    ):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+
+        self._model = None
+        self._lock = threading.Lock()
+
+        # Slot i: embs[i] ↔ responses[i] ↔ partitions[i] ↔ last_used[i], ilk `size` slot dolu.
+        # Diziler max_entries kapasiteyle bir kez ayrılır; put() boş slota / LRU kaydın
+        # slotuna yazar (embs embedding boyutu ilk kayıtta belli olunca ayrılır)
+        self.embs: Optional[np.ndarray] = None
+        self.responses: list = [None] * max_entries
+        self.partitions = np.empty(max_entries, dtype=object)
+        self.last_used = np.zeros(max_entries, dtype=np.int64)
+        self.size = 0
+        self._clock = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    # ── Public API ──
+    def get(self, text: str, partition: str) -> Optional[str]:
+        """
+        Aynı bölmedeki eşik üstü en benzer kaydın yanıtını döndürür, yoksa None.
+
+        Args:
+            text: Prompt'un değişken kısmı (yorumlar; şablon hariç)
+            partition: "model|prompt türü|max_tokens" — farklı bölmeler karşılaştırılmaz
+        """
+        emb = self._encode(text)
+
+        with self._lock:
+            if not self.size:
+                self.misses += 1
+                return None
+
+            sims = self.embs[: self.size] @ emb
+            sims[self.partitions[: self.size] != partition] = -1.0
+            best = int(sims.argmax())
+
+            if sims[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self._clock += 1
+            self.last_used[best] = self._clock
+            self.hits += 1
+
+            logger.debug(f"Semantic cache hit (sim={sims[best]:.3f})")
+            return self.responses[best]
+
+    def put(self, text: str, partition: str, response: str) -> None:
+        """Yeni kaydı ekler; kapasite doluysa en eski kullanılanın slotuna yazar."""
+        emb = self._encode(text)
+
+        with self._lock:
+            if self.embs is None:
+                self.embs = np.empty((self.max_entries, emb.shape[0]), dtype=np.float32)
+
+            if self.size < self.max_entries:
+                slot = self.size
+                self.size += 1
+            else:
+                slot = int(self.last_used.argmin())
+
+            self._clock += 1
+            self.embs[slot] = emb
+            self.responses[slot] = response
+            self.partitions[slot] = partition
+            self.last_used[slot] = self._clock
+
+    def save(self) -> None:
+        """Önbelleği diske yazar."""
+        with self._lock:
+            state = {
+                "version": SEMANTIC_CACHE_VERSION,
+                "model": self.model_name,
+                "embs": self.embs[: self.size] if self.embs is not None else None,
+                "responses": self.responses[: self.size],
+                "partitions": self.partitions[: self.size],
+                "last_used": self.last_used[: self.size],
+            }
+            with open(self.path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        logger.info(
+            f"💾 Semantic cache kaydedildi: {self.size} kayıt "
+            f"(hit: {self.hits}, miss: {self.misses})"
+        )
+
+    # ── Yardımcılar ──
+    def _encode(self, text: str) -> np.ndarray:
+        """
+        Metni birim uzunlukta vektöre çevirir (cosine = iç çarpım).
+
+        Model sınırından uzun metinler EMBED_SEGMENT_CHARS'lık parçalar halinde
+        embed edilip ortalanır.
+        """
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    logger.info(f"Embedding modeli yükleniyor: {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name)
+
+        segments = [
+            text[i : i + EMBED_SEGMENT_CHARS] for i in range(0, len(text), EMBED_SEGMENT_CHARS)
+        ] or [""]
+        emb = self._model.encode(segments, normalize_embeddings=True).mean(axis=0)
+        return (emb / (np.linalg.norm(emb) or 1.0)).astype(np.float32)
+
+    def _load(self) -> None:
+        """Diskteki önbelleği yükler (farklı modelle oluşturulduysa yok sayar)."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Semantic cache okunamadı, sıfırdan başlanıyor: {e}")
+            return
+
+        if state.get("version") != SEMANTIC_CACHE_VERSION:
+            logger.info("Semantic cache eski formatta, yok sayıldı.")
+            return
+
+        if state.get("model") != self.model_name:
+            logger.info("Semantic cache farklı bir embedding modeline ait, yok sayıldı.")
+            return
+
+        embs, last_used = state["embs"], state["last_used"]
+        if embs is None or not len(last_used):
+            return
+
+        # Kapasite küçüldüyse en son kullanılan max_entries kayıt alınır
+        keep = np.sort(np.argsort(last_used)[-self.max_entries :])
+        size = len(keep)
+
+        self.embs = np.empty((self.max_entries, embs.shape[1]), dtype=np.float32)
+        self.embs[:size] = embs[keep]
+        for slot, i in enumerate(keep):
+            self.responses[slot] = state["responses"][i]
+        self.partitions[:size] = state["partitions"][keep]
+        self.last_used[:size] = last_used[keep]
+        self.size = size
+        self._clock = int(last_used.max())
+
+        logger.info(f"Semantic cache yüklendi: {size} kayıt")
@@ -0,0 +1,138 @@
+"""
+src/ai_analysis/rate_limit.py
+
+OpenAI istekleri için proaktif hız sınırlayıcı.
+- TokenBucket: dakikalık istek (RPM) ve token (TPM) limitlerini birlikte takip eder
+- İstek, iki kovada da yer açılır açılmaz gönderilir (sabit sleep yok, 429 yok)
+- Prompt token sayısı tiktoken kuruluysa onunla, değilse karakter sayısından tahmin edilir
+  (aynı tahmin chunk'ları token bütçesine göre paketlerken de kullanılır)
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# TOKEN TAHMİNİ
+# ─────────────────────────────────────────
+
+CHARS_PER_TOKEN = 3  # tiktoken yoksa kaba tahmin (Türkçe metinler için)
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """Modelin tiktoken encoding'i; tiktoken kurulu değilse None."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(model: str, text: str) -> int:
+    """Metnin yaklaşık prompt token sayısı."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(model: str, text: str, max_tokens: int) -> str:
+    """Metnin ilk max_tokens token'ını tutar, kalanını atar."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[: max(max_tokens - 1, 0) * CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+# ─────────────────────────────────────────
+# TOKEN BUCKET
+# ─────────────────────────────────────────
+
+class TokenBucket:
+    """
+    İstek ve token kovası (OpenAI cookbook'taki paralel işleyici mantığı).
+
+    Her iki kova da saniyede rpm/60 ve tpm/60 oranında dolar; kapasiteleri
+    bir dakikalık limittir. acquire() yer açılana kadar bekler, sonra düşer.
+
+    Kullanımı:
+        bucket = TokenBucket(rpm=3500, tpm=90_000)
+        bucket.acquire(1, tahmini_token)           # senkron
+        await bucket.aacquire(1, tahmini_token)    # asenkron
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.max_requests = float(rpm)
+        self.max_tokens = float(tpm)
+
+        self.available_requests = self.max_requests
+        self.available_tokens = self.max_tokens
+
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """Yer açılana kadar bloklayarak bekler."""
+        while True:
+            wait = self._try_acquire(requests, tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """acquire()'ın event loop'u bloklamayan hali."""
+        while True:
+            wait = self._try_acquire(requests, tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _try_acquire(self, requests: int, tokens: int) -> float:
+        """
+        Yer varsa düşer ve 0 döner; yoksa beklenmesi gereken süreyi döner.
+
+        Kapasiteyi aşan tek bir istek kova dolunca geçer (sonsuz beklemez).
+        """
+        requests = min(float(requests), self.max_requests)
+        tokens = min(float(tokens), self.max_tokens)
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last
+            self._last = now
+
+            # Geçen süre kadar doldur (kapasiteyi aşmadan)
+            self.available_requests = min(
+                self.max_requests, self.available_requests + elapsed * self.max_requests / 60
+            )
+            self.available_tokens = min(
+                self.max_tokens, self.available_tokens + elapsed * self.max_tokens / 60
+            )
+
+            if self.available_requests >= requests and self.available_tokens >= tokens:
+                self.available_requests -= requests
+                self.available_tokens -= tokens
+                return 0.0
+
+            # Eksik olan kovanın dolması için gereken süre
+            wait_requests = (requests - self.available_requests) * 60 / self.max_requests
+            wait_tokens = (tokens - self.available_tokens) * 60 / self.max_tokens
+            wait = max(wait_requests, wait_tokens, 0.0)
+
+        logger.debug(f"Rate limit: {wait:.2f}s bekleniyor")
+        return wait
@@ -29,6 +29,11 @@ class Settings:
     PROCESSED_DATA_DIR: Path = DATA_DIR / "processed"
     OUTPUT_DIR: Path = DATA_DIR / "output"
     LOG_DIR: Path = BASE_DIR / "logs"
+    BATCH_DIR: Path = DATA_DIR / "batches"  # Batch API JSONL dosyaları
+    LLM_CACHE_FILE: Path = DATA_DIR / "llm_cache"  # shelve dosyası
+    SEMANTIC_CACHE_FILE: Path = DATA_DIR / "semantic_cache.pkl"
+    DRIVER_CACHE_DIR: Path = DATA_DIR / "wdm"  # webdriver-manager'ın indirdiği chromedriver
+    SUMMARY_CACHE_FILE: Path = DATA_DIR / "summary_cache"  # shelve: yorum URL'si → özet var mı
 
     # --- Dosya Adları ---
     PRODUCT_LINKS_FILE: str = "product_links.txt"
@@ -42,7 +47,28 @@ class Settings:
     SCRAPER_TIMEOUT: int = 30
     SCRAPER_MAX_RETRIES: int = 3
     SCRAPER_PAGE_LOAD_TIMEOUT: int = 60
-    REQUESTS_PER_MINUTE: int = 30
+    SCRAPER_PAGE_LOAD_STRATEGY: str = "eager"  # driver.get DOM hazır olunca döner (onload beklenmez)
+    LISTING_WAIT_TIMEOUT: int = 5  # Listeleme sayfasında ürün kartları için bekleme (saniye)
+    SUMMARY_WAIT_TIMEOUT: int = 3  # Yorum sayfasında özet başlığı için bekleme (saniye)
+    WAIT_POLL_FREQUENCY: float = 0.2  # WebDriverWait koşulu kaç saniyede bir kontrol eder
+    DRIVER_CACHE_DAYS: int = 7  # chromedriver sürüm kontrolü kaç günde bir yapılır
+    # Hız limiti host başına ve tüm thread'ler için ortaktır: thread eklemek bu hızı artırmaz.
+    # Gereken eşzamanlılık ≈ saniyedeki istek × istek süresi (0.5 istek/s × ~1s → 1-2 thread)
+    REQUESTS_PER_MINUTE: int = 30  # Listeleme sayfası + Chrome gezinmesi (host başına)
+    SCRAPER_WORKERS: int = 4  # Aynı anda taranan kategori sayısı (thread) = limiter patlama kapasitesi
+    SCRAPER_WORKER_STAGGER: float = 0.1  # Thread'ler arası başlangıç gecikmesi (saniye)
+    # Yorum sayfası kontrolleri de aynı host bütçesinden harcar (toplam hız REQUESTS_PER_MINUTE)
+    SUMMARY_CHECK_WORKERS: int = 4  # Bütçe ortak olduğundan daha fazla thread hız kazandırmaz
+    SUMMARY_CACHE_DAYS: int = 7  # Özet kontrolü sonucu kaç gün geçerli sayılır
+    HTTP_MAX_CONNECTIONS: int = 20  # HttpScraper bağlantı havuzu
+    HTTP_IMPERSONATE: str = "chrome124"  # curl_cffi kuruluysa taklit edilen tarayıcı parmak izi
+    # Chrome'da hiç indirilmeyen kaynaklar (CDP Network.setBlockedURLs kalıpları)
+    SCRAPER_BLOCKED_URLS: list = [
+        "*.woff*", "*.ttf", "*.otf", "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif",
+        "*.mp4", "*.webm", "*.svg", "*googletag*", "*analytics*", "*doubleclick*",
+    ]
+    # CSS de engellensin mi (lazy-load CSS'e bağlı olursa selector'lar bozulabilir → False)
+    SCRAPER_BLOCK_CSS: bool = True
 
     # --- Ürün Filtreleri ---
     MIN_REVIEWS_REQUIRED: int = 1000
@@ -50,8 +76,35 @@ class Settings:
 
     # --- AI Ayarları ---
     AI_MODEL: str = "gpt-3.5-turbo"
+    AI_MODEL_CHUNK: str = "gpt-4o-mini"  # Chunk özetleri (çok sayıda kısa istek → ucuz model)
+    AI_MODEL_FINAL: str = "gpt-4o-mini"  # Final birleştirme (ürün başına tek istek)
     AI_MAX_TOKENS: int = 1000
-    CHUNK_SIZE: int = 200  # Her chunk'ta kaç yorum işlenir
+    # json_schema structured output destekleyen model önekleri (final özet şemayla istenir)
+    STRUCTURED_OUTPUT_MODELS: tuple = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+    CHUNK_SIZE: int = 200  # Bir chunk'ta en fazla kaç yorum olur
+    CHUNK_TOKEN_BUDGET: int = 3000  # Chunk prompt'unun (yorumlar + şablon) input token bütçesi
+    SINGLE_SHOT_TOKEN_BUDGET: int = 8000  # Bu bütçeye sığan ürün tek istekte özetlenir (0 → kapalı)
+    DEDUP_REVIEWS: bool = True  # Tekrar eden / çok benzer yorumlar LLM'e bir kez gönderilir
+    DEDUP_THRESHOLD: float = 0.8  # MinHash ile tahmini Jaccard benzerlik eşiği
+    REVIEWS_READ_BLOCK_SIZE: int = 64 << 20  # Yorum CSV'si Parquet'e dönüştürülürken blok boyutu (byte)
+    CHUNKS_PER_REQUEST: int = 4  # Tek API isteğinde özetlenen chunk sayısı
+    MAX_CONCURRENCY: int = 10  # Aynı anda gönderilen en fazla chunk isteği
+    PRODUCT_CONCURRENCY: int = 4  # Aynı anda işlenen ürün sayısı (thread)
+    AI_RPM: int = 3500  # Hesabın dakikalık istek limiti
+    AI_TPM: int = 90_000  # Hesabın dakikalık token limiti
+
+    # --- Batch API (offline pipeline) ---
+    USE_BATCH_API: bool = False  # True → run_ai_analysis OpenAI Batch API kullanır
+    BATCH_POLL_INTERVAL: int = 60  # Batch durumu kaç saniyede bir kontrol edilir
+
+    # --- Prompt Cache ---
+    PROMPT_CACHE: bool = True  # Aynı prompt tekrar gönderilmez (--no-cache ile kapatılır)
+
+    # --- Semantic Cache (pip install sentence-transformers) ---
+    SEMANTIC_CACHE: bool = False  # True → benzer prompt'lar önbellekten yanıtlanır
+    SEMANTIC_CACHE_THRESHOLD: float = 0.87  # Cosine benzerlik eşiği
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 10_000  # Aşılınca en eski kullanılan silinir
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
 
     # --- Hepsiburada Kategoriler ---
     HEPSIBURADA_CATEGORIES: list = [
@@ -77,6 +130,7 @@ class Settings:
             self.PROCESSED_DATA_DIR,
             self.OUTPUT_DIR,
             self.LOG_DIR,
+            self.BATCH_DIR,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
 
@@ -0,0 +1,144 @@
+"""
+src/data_processing/dashboard_data.py
+
+Dashboard'un kullandığı ürün verisini hazırlayan modül.
+- Ham CSV'yi okur, fiyat / yorum / AI önceliği sütunlarını türetir
+- Hazırlanan veriyi Parquet olarak kaydeder (tek seferlik dönüşüm)
+- Parquet güncelse dashboard CSV'yi hiç parse etmeden onu okur
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# SABİTLER
+# ─────────────────────────────────────────
+
+PRODUCTS_CSV = Path("urunler_ai_ozetli.csv")
+PRODUCTS_PARQUET = Path("urunler_ai_ozetli.parquet")
+
+PRICE_ORDER = ["0–100 ₺", "100–500 ₺", "500–1K ₺", "1K–5K ₺", "5K+ ₺"]
+PRICE_BINS = np.array([100, 500, 1000, 5000], dtype=np.float64)  # PRICE_ORDER aralık sınırları
+STAR_COLUMNS = ["5star", "4star", "3star", "2star", "1star"]
+TEXT_COLUMNS = ["urun_id", "urun_adi", "fiyat", "ai_ozet", "yorum_ozeti"]
+AI_ERROR_PATTERN = r"Error|context_length"  # Başarısız AI çıktılarında görülen kalıplar
+
+
+# ─────────────────────────────────────────
+# DÖNÜŞÜMLER
+# ─────────────────────────────────────────
+
+def has_valid_ai(col: pd.Series) -> pd.Series:
+    """
+    AI Analizi Var mı Kontrolü (Hata içermeyen ve uzunluğu >20 olanlar).
+
+    Tüm sütun tek seferde taranır; hata mesajı varsa veya boşsa 0, değilse 1.
+    """
+    s = col.astype("string[pyarrow]").fillna("")
+    # İki hata kalıbı tek regex'te: her metin bir kez taranır
+    valid = (s.str.len() > 20) & ~s.str.contains(AI_ERROR_PATTERN, regex=True)
+    return valid.astype("int8")
+
+
+def preprocess(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ham ürün tablosuna dashboard sütunlarını ekler.
+
+    Eklenen sütunlar: fiyat_num, toplam_yorum, fiyat_araligi, ai_priority.
+    Sayısal sütunlar küçük tiplere, metin sütunları Arrow string'e çevrilir.
+    """
+    # "1.149,90 TL" → 1149.90 (tüm sütun tek seferde)
+    price_str = (
+        df["fiyat"].astype("string")
+        .str.replace("TL", "", regex=False).str.strip()
+        .str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    )
+    df["fiyat_num"] = pd.to_numeric(price_str, errors="coerce").fillna(0.0).astype("float64")
+
+    # Toplam yorum sayısı
+    if set(STAR_COLUMNS).issubset(df.columns):
+        df["toplam_yorum"] = df[STAR_COLUMNS].sum(axis=1)
+    else:
+        df["toplam_yorum"] = 0
+
+    # Fiyat aralığı: sınırlar üzerinde tek ikili arama, sonuç 1 byte'lık kategori kodu
+    codes = np.digitize(df["fiyat_num"].to_numpy(), PRICE_BINS)
+    df["fiyat_araligi"] = pd.Categorical.from_codes(codes, categories=PRICE_ORDER, ordered=True)
+
+    if "ai_ozet" not in df.columns: df["ai_ozet"] = None
+    if "yorum_ozeti" not in df.columns: df["yorum_ozeti"] = None
+
+    # AI önceliği statik — hazırlık sırasında bir kez hesaplanır
+    df["ai_priority"] = has_valid_ai(df["ai_ozet"])
+
+    # Küçük tipler → daha az bellek, daha hızlı sum/mean/value_counts
+    for c in [c for c in STAR_COLUMNS + ["toplam_yorum"] if c in df.columns]:
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype("int32")
+    df["ortalama_star_puani"] = df["ortalama_star_puani"].astype("float32")
+    for c in TEXT_COLUMNS:
+        df[c] = df[c].astype("string[pyarrow]")
+
+    return df
+
+
+# ─────────────────────────────────────────
+# OKUMA / YAZMA
+# ─────────────────────────────────────────
+
+def load_products(
+    csv_path: Path = PRODUCTS_CSV,
+    parquet_path: Path = PRODUCTS_PARQUET,
+) -> pd.DataFrame:
+    """
+    Hazırlanmış ürün tablosunu döndürür.
+
+    Parquet dosyası CSV'den yeniyse doğrudan okunur (parse ve dönüşüm yok);
+    değilse CSV okunup preprocess() uygulanır.
+
+    Raises:
+        FileNotFoundError: CSV de Parquet de yoksa
+    """
+    csv_path, parquet_path = Path(csv_path), Path(parquet_path)
+
+    if parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        logger.debug(f"Parquet okunuyor: {parquet_path}")
+        return pd.read_parquet(parquet_path)
+
+    # pyarrow streamlit ile birlikte kurulu gelir; çok çekirdekli CSV okuyucu
+    return preprocess(pd.read_csv(csv_path, engine="pyarrow"))
+
+
+def convert_to_parquet(
+    csv_path: Path = PRODUCTS_CSV,
+    parquet_path: Path = PRODUCTS_PARQUET,
+) -> Path:
+    """CSV'yi okur, hazırlar ve zstd sıkıştırmalı Parquet olarak kaydeder."""
+    df = preprocess(pd.read_csv(csv_path, engine="pyarrow"))
+    df.to_parquet(parquet_path, compression="zstd", index=False)
+
+    logger.info(f"💾 {len(df)} ürün → {parquet_path}")
+    return Path(parquet_path)
+
+
+# ─────────────────────────────────────────
+# ÇALIŞTIRMA (python -m src.data_processing.dashboard_data)
+# ─────────────────────────────────────────
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    print("📦 Dashboard verisi Parquet'e dönüştürülüyor...\n")
+    output = convert_to_parquet()
+    print(f"\n✅ Tamamlandı! Dosya: {output}")
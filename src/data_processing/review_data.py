@@ -0,0 +1,189 @@
+"""
+src/data_processing/review_data.py
+
+AI analizinin okuduğu yorum verisini hazırlayan modül.
+- Ham yorum CSV'sini (product_id, review) Parquet'e dönüştürür (tek seferlik, parça parça)
+- Parquet güncelse CSV hiç parse edilmeden sadece gereken iki sütun okunur
+- Yorumlar ürün ürün akıtılır: tüm dosya hiçbir zaman tek tabloda / tek sözlükte tutulmaz
+"""
+
+import os
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src.config.config_settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# SABİTLER
+# ─────────────────────────────────────────
+
+REVIEW_COLUMNS = ["product_id", "review"]
+REVIEW_SCHEMA = pa.schema([("product_id", pa.string()), ("review", pa.string())])
+READ_BATCH_ROWS = 65_536  # Parquet'ten tek seferde okunan satır sayısı
+
+
+# ─────────────────────────────────────────
+# OKUMA / YAZMA
+# ─────────────────────────────────────────
+
+def reviews_parquet_path(csv_path: Path) -> Path:
+    """reviews.csv → reviews.parquet (aynı klasörde)."""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def convert_reviews_to_parquet(csv_path: Path, parquet_path: Optional[Path] = None) -> Path:
+    """
+    Yorum CSV'sini blok blok okuyup zstd sıkıştırmalı Parquet'e yazar.
+
+    Dosyanın tamamı belleğe alınmaz; sadece product_id ve review sütunları yazılır.
+    Önce geçici dosyaya yazılır, sonra os.replace ile yerine konur (yarıda kalan
+    dönüşüm geçerli ama eksik bir Parquet bırakıp güncel sanılmasın diye).
+    """
+    csv_path = Path(csv_path)
+    parquet_path = Path(parquet_path or reviews_parquet_path(csv_path))
+
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=settings.REVIEWS_READ_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=REVIEW_COLUMNS,
+            column_types=REVIEW_SCHEMA,
+            strings_can_be_null=True,  # boş hücre → null (pandas ile aynı)
+        ),
+    )
+
+    tmp_path = parquet_path.with_suffix(".parquet.tmp")
+    rows = 0
+    try:
+        with pq.ParquetWriter(tmp_path, REVIEW_SCHEMA, compression="zstd") as writer:
+            for batch in reader:
+                writer.write_batch(batch.select(REVIEW_COLUMNS))
+                rows += batch.num_rows
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp_path, parquet_path)
+
+    logger.info(f"💾 {rows} yorum → {parquet_path}")
+    return parquet_path
+
+
+def iter_grouped_reviews(csv_path: Path) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yorumları ürün ürün üretir: (product_id, [yorum, ...]).
+
+    Parquet yoksa veya CSV'den eskiyse önce dönüştürülür. Dosya iki kez batch batch
+    okunur: ilk geçişte sadece product_id sütunundan her ürünün son satırı bulunur,
+    ikinci geçişte bir ürünün yorumları o satıra gelince yield edilip bırakılır.
+    Bellekte sadece henüz son satırına gelinmemiş ürünlerin yorumları tutulur
+    (scraper'ın yazdığı gibi ardışık satırlarda tek ürün).
+
+    Ürünler son satırlarının dosyadaki sırasıyla, yorumlar dosyadaki sırasıyla döner.
+    ID'si veya yorumu boş satırlar atlanır; hiç yorumu kalmayan ürün üretilmez.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = reviews_parquet_path(csv_path)
+
+    if not parquet_path.exists() or (
+        csv_path.exists() and parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+    ):
+        convert_reviews_to_parquet(csv_path, parquet_path)
+
+    all_ids, all_last_rows = _last_rows(parquet_path)
+
+    pending: Dict[str, List[str]] = {}
+    offset = 0
+
+    # product_id kategorik (dictionary) okunur → batch içi gruplama tamsayı kodlar üzerinden
+    parquet = pq.ParquetFile(parquet_path, read_dictionary=["product_id"])
+    for batch in parquet.iter_batches(batch_size=READ_BATCH_ROWS, columns=REVIEW_COLUMNS):
+        table = pa.Table.from_batches([batch])
+        end = offset + batch.num_rows
+        offset = end
+
+        # Batch içinde ürün başına tek liste (Arrow'da, satır satır Python döngüsü yok);
+        # use_threads=False → grup içindeki yorum sırası korunur
+        valid = table.filter(pc.and_(pc.is_valid(table["review"]), pc.is_valid(table["product_id"])))
+        grouped = valid.group_by("product_id", use_threads=False).aggregate([("review", "list")])
+        for product_id, reviews in zip(
+            _decode(grouped["product_id"]).to_pylist(), grouped["review_list"].to_pylist()
+        ):
+            pending.setdefault(product_id, []).extend(reviews)
+
+        # Son satırı bu batch'te olan ürünler (yorumu boş son satırlar dahil) bırakılır
+        present = _decode(pc.unique(table["product_id"]).drop_null())
+        last_rows = all_last_rows[pc.index_in(present, value_set=all_ids).to_numpy()]
+        done = np.flatnonzero(last_rows < end)
+
+        present_ids = present.to_pylist()
+        for idx in done[np.argsort(last_rows[done], kind="stable")]:
+            product_reviews = pending.pop(present_ids[idx], None)
+            if product_reviews:
+                yield present_ids[idx], product_reviews
+
+
+def _decode(ids) -> pa.Array:
+    """Dictionary kodlu product_id'leri (Array / ChunkedArray) düz string dizisine çevirir."""
+    if isinstance(ids, pa.ChunkedArray):
+        ids = ids.combine_chunks()
+    return pc.cast(ids, pa.string())
+
+
+def _last_rows(parquet_path: Path) -> Tuple[pa.Array, np.ndarray]:
+    """
+    Her ürünün dosyadaki son satır numarası — sadece product_id sütunu okunur.
+
+    Returns:
+        (product_id dizisi, aynı sıradaki son satır numaraları)
+    """
+    parts = []
+    offset = 0
+
+    # product_id kategorik (dictionary) okunur → son satırlar tamsayı kodlar üzerinden bulunur
+    parquet = pq.ParquetFile(parquet_path, read_dictionary=["product_id"])
+    for batch in parquet.iter_batches(batch_size=READ_BATCH_ROWS, columns=["product_id"]):
+        column = batch.column(0)
+        codes = pc.fill_null(column.indices, -1).to_numpy()
+
+        # Ters çevrilmiş dizideki ilk geçiş = batch içindeki son geçiş
+        unique_codes, first_from_end = np.unique(codes[::-1], return_index=True)
+        keep = unique_codes >= 0
+        parts.append(pa.table({
+            "product_id": column.dictionary.take(pa.array(unique_codes[keep])),
+            "last_row": offset + len(codes) - 1 - first_from_end[keep],
+        }))
+        offset += len(codes)
+
+    if not parts:
+        return pa.array([], pa.string()), np.empty(0, dtype=np.int64)
+
+    # Batch'lerin son satırlarından ürün başına en büyüğü
+    last = pa.concat_tables(parts).group_by("product_id").aggregate([("last_row", "max")])
+    return last["product_id"].combine_chunks(), last["last_row_max"].to_numpy()
+
+
+# ─────────────────────────────────────────
+# ÇALIŞTIRMA (python -m src.data_processing.review_data)
+# ─────────────────────────────────────────
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    print("📦 Yorum verisi Parquet'e dönüştürülüyor...\n")
+    output = convert_reviews_to_parquet(settings.RAW_DATA_DIR / settings.REVIEWS_CSV)
+    print(f"\n✅ Tamamlandı! Dosya: {output}")
@@ -8,15 +8,19 @@ Tüm scraper'ların kullanacağı temel sınıf.
 """
 
 import time
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
-from functools import wraps
+from typing import Optional, Any, Dict, Tuple
+from functools import wraps, lru_cache
+from urllib.parse import urlsplit
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     WebDriverException,
@@ -24,6 +28,7 @@ from selenium.common.exceptions import (
     NoSuchElementException,
 )
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
 
 # Kendi settings'imizi import ediyoruz
 from src.config.config_settings import settings
@@ -96,30 +101,52 @@ class RateLimiter:
     """
     Belirli bir süre içinde yapılan istek sayısını sınırlar.
     Böylece site tarafından engellenmekten kaçınılır.
+
+    Host başına token bucket: kova saniyede max_requests / time_window oranında dolar,
+    kapasitesi `burst` isteklik anlık patlamadır. Her istek kovadan bir token düşer;
+    token yoksa sıradaki boş zamanı ayırır ve o ana kadar bekler (kilit tutmadan).
+
+    Thread-safe: aynı limiter birden fazla thread'den paylaşılabilir. Paylaşan
+    thread'lerin toplam hızı yine max_requests / time_window'dur; thread sayısı
+    bu hızı aşmaz, sadece bekleyen istek sayısını artırır.
     """
 
-    def __init__(self, max_requests: int = 30, time_window: int = 60):
+    def __init__(self, max_requests: int = 30, time_window: int = 60, burst: int = 1):
         self.max_requests = max_requests
         self.time_window = time_window  # saniye
-        self.requests: list = []
+        self.burst = max(1, burst)
+        self.rate = max_requests / time_window  # saniyede istek
+
+        # host → (kalan token, son güncelleme zamanı); token eksiye düşebilir (ayrılmış sıra)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
 
-    def wait_if_needed(self) -> None:
-        """Limit dolmak üzereyse bekle."""
-        now = time.time()
+    def wait_if_needed(self, url: Optional[str] = None) -> None:
+        """Bu host için sıra gelene kadar bekle."""
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
 
-        # Zaman penceresi dışında kalan eski istekleri sil
-        self.requests = [
-            t for t in self.requests if now - t < self.time_window
-        ]
+    async def wait_if_needed_async(self, url: Optional[str] = None) -> None:
+        """wait_if_needed()'ın event loop'u bloklamayan hali (aynı kova, aynı sıra)."""
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
 
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.time_window - (now - self.requests[0]) + 1
-            if sleep_time > 0:
-                logger.info(f"Rate limit doldu. {sleep_time:.1f}s beklenecek...")
-                time.sleep(sleep_time)
-                self.requests = []
+    def _reserve(self, url: Optional[str]) -> float:
+        """Bir token ayırır; beklenmesi gereken süreyi döndürür (kilit altında sadece hesap)."""
+        host = urlsplit(url).netloc if url else ""
 
-        self.requests.append(now)
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate) - 1
+            self._buckets[host] = (tokens, now)
+
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        if wait >= 1:
+            logger.info(f"Rate limit doldu ({host or 'varsayılan'}). {wait:.1f}s beklenecek...")
+        return wait
 
 
 # ─────────────────────────────────────────
@@ -147,7 +174,8 @@ class BaseScraper(ABC):
         self.headless = headless
         self.timeout = timeout
         self.rate_limiter = rate_limiter or RateLimiter(
-            max_requests=settings.REQUESTS_PER_MINUTE
+            max_requests=settings.REQUESTS_PER_MINUTE,
+            burst=settings.SCRAPER_WORKERS,
         )
 
         self._driver: Optional[webdriver.Chrome] = None
@@ -171,17 +199,56 @@ class BaseScraper(ABC):
         options.add_argument("--disable-dev-shm-usage")
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
-        # Resim yüklememe → daha hızlı
-        prefs = {"profile.default_content_setting_values": {"images": 2}}
+        # "eager": driver.get() DOMContentLoaded'da döner; reklam / analitik
+        # script'lerinin ve alt kaynakların (onload) bitmesi beklenmez
+        options.page_load_strategy = settings.SCRAPER_PAGE_LOAD_STRATEGY
+
+        # Resim yüklememe → daha hızlı ("managed" tercih site ayarlarıyla ezilemez)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs = {
+            "profile.default_content_setting_values": {"images": 2},
+            "profile.managed_default_content_settings.images": 2,
+        }
         options.add_experimental_option("prefs", prefs)
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(self._driver_path())
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(settings.SCRAPER_PAGE_LOAD_TIMEOUT)
 
+        self._block_resources(driver)
+
         logger.info("WebDriver hazır.")
         return driver
 
+    @staticmethod
+    def _block_resources(driver: webdriver.Chrome) -> None:
+        """
+        CSS, font, medya ve takip script'lerini aktif sekmede hiç indirmez (DOM etkilenmez).
+
+        CDP ayarı sekmeye özeldir; yeni açılan sekmelerde tekrar çağrılmalıdır.
+        """
+        urls = list(settings.SCRAPER_BLOCKED_URLS)
+        if settings.SCRAPER_BLOCK_CSS:
+            urls.append("*.css")
+
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _driver_path(cls) -> str:
+        """
+        chromedriver yolunu bir kez çözer; aynı süreçteki sonraki driver'lar tekrar kullanır.
+
+        İndirilen driver data/wdm altında DRIVER_CACHE_DAYS gün geçerli sayılır,
+        bu sürede yeni süreçler de sürüm kontrolü için ağa çıkmaz.
+        """
+        cache_manager = DriverCacheManager(
+            root_dir=str(settings.DRIVER_CACHE_DIR),
+            valid_range=settings.DRIVER_CACHE_DAYS,
+        )
+        return ChromeDriverManager(cache_manager=cache_manager).install()
+
     # ── Lazy-load properties ──
     @property
     def driver(self) -> webdriver.Chrome:
@@ -198,13 +265,60 @@ class BaseScraper(ABC):
         return self._wait
 
     # ── Sayfa açma ──
+    def get_page(
+        self,
+        url: str,
+        wait_for: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        URL'ye git. Başarısız olursa otomatik tekrar dener.
+
+        Args:
+            url: Açılacak sayfa
+            wait_for: (By, selector) — verilirse bu element DOM'a gelene kadar beklenir
+            timeout: wait_for için bekleme süresi (None → self.timeout)
+
+        Raises:
+            TimeoutException: wait_for elementi timeout süresinde gelmezse
+        """
+        self._navigate(url)
+
+        if wait_for is not None:
+            self.wait_for(wait_for, timeout)
+
+    def wait_for(self, locator: Tuple[str, str], timeout: Optional[float] = None):
+        """
+        Element DOM'a gelene kadar bekler, elementi döndürür.
+
+        Raises:
+            TimeoutException: timeout süresinde gelmezse
+        """
+        return self.wait_until(EC.presence_of_element_located(locator), timeout)
+
+    def wait_until(self, condition, timeout: Optional[float] = None):
+        """
+        Koşul sağlanana kadar bekler (her çağrı kendi süresiyle, sık aralıkla kontrol eder).
+
+        Args:
+            condition: driver alıp truthy değer döndüren callable (EC.* veya lambda)
+            timeout: Bekleme süresi (None → self.timeout)
+
+        Raises:
+            TimeoutException: timeout süresinde sağlanmazsa
+        """
+        wait = WebDriverWait(
+            self.driver,
+            self.timeout if timeout is None else timeout,
+            poll_frequency=settings.WAIT_POLL_FREQUENCY,
+        )
+        return wait.until(condition)
+
     @retry_on_failure(max_retries=3)
-    def get_page(self, url: str) -> None:
-        """URL'ye git. Başarısız olursa otomatik tekrar dener."""
-        self.rate_limiter.wait_if_needed()
+    def _navigate(self, url: str) -> None:
+        self.rate_limiter.wait_if_needed(url)
         logger.debug(f"Sayfa açılıyor: {url}")
         self.driver.get(url)
-        time.sleep(1)  # Sayfa stabilize olsun
 
     # ── Kapatma ──
     def close(self) -> None:
@@ -0,0 +1,197 @@
+"""
+src/scrapers/http_scraper.py
+
+Tarayıcısız (Selenium'suz) HTML çekme katmanı.
+- httpx.AsyncClient (HTTP/2, bağlantı havuzu) ile sayfaları indirir
+- curl_cffi kuruluysa onun yerine Chrome'un TLS / HTTP2 parmak izini taklit eden
+  AsyncSession kullanılır (TLS fingerprint kontrolü yapan bot korumasına takılmaz)
+- selectolax (lexbor) ile CSS selector'la parse eder (BeautifulSoup/lxml'den çok daha hızlı)
+- Sunucuda render edilen sayfalar (kategori / listeleme) için; JS gereken
+  sayfalarda BaseScraper (Chrome) kullanılmaya devam eder
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+
+try:
+    # opsiyonel: pip install curl_cffi
+    from curl_cffi.requests import AsyncSession as CurlSession
+    from curl_cffi.requests.exceptions import RequestException as CurlError
+except ImportError:
+    CurlSession = None
+    CurlError = None
+
+from src.scrapers.base_scraper import RateLimiter, ScraperException
+from src.config.config_settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# SABİTLER
+# ─────────────────────────────────────────
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.8",
+}
+
+# curl_cffi User-Agent / Accept başlıklarını taklit ettiği tarayıcıya göre kendisi koyar
+IMPERSONATE_HEADERS = {"Accept-Language": DEFAULT_HEADERS["Accept-Language"]}
+
+HTTP_ERRORS = (httpx.HTTPError,) + ((CurlError,) if CurlError is not None else ())
+
+
+class HttpStatusError(ScraperException):
+    """Sunucu 2xx/3xx dışı bir yanıt döndürdü (404, 403, 429, 5xx...)."""
+
+    def __init__(self, url: str, status_code: int):
+        super().__init__(f"HTTP {status_code}: {url}")
+        self.url = url
+        self.status_code = status_code
+
+
+# ─────────────────────────────────────────
+# HTTP SCRAPER
+# ─────────────────────────────────────────
+
+class HttpScraper:
+    """
+    HTTP ile HTML çeken hafif scraper (Chrome açmaz).
+
+    Kullanımı:
+        with HttpScraper() as http:
+            tree = http.fetch_html(url)              # senkron kod içinden
+            cards = tree.css("li.product")
+
+        # veya async kod içinden:
+        tree = await http.fetch(url)
+        trees = await http.fetch_many(urls)
+    """
+
+    def __init__(
+        self,
+        timeout: int = settings.SCRAPER_TIMEOUT,
+        max_connections: int = settings.HTTP_MAX_CONNECTIONS,
+        rate_limiter: Optional[RateLimiter] = None,
+        impersonate: Optional[str] = settings.HTTP_IMPERSONATE,
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter or RateLimiter(
+            max_requests=settings.REQUESTS_PER_MINUTE
+        )
+
+        # curl_cffi yoksa veya impersonate=None ise httpx kullanılır
+        self.impersonate = impersonate if CurlSession is not None else None
+
+        # Senkron çağrılar için tek bir event loop; client bu loop'a bağlı yaşar
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client = None
+
+    # ── Client ──
+    @property
+    def client(self):
+        """Client ilk istekte açılır, bağlantılar sonraki isteklerde tekrar kullanılır."""
+        if self._client is None:
+            if self.impersonate:
+                self._client = CurlSession(
+                    impersonate=self.impersonate,
+                    headers=IMPERSONATE_HEADERS,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    max_clients=self.max_connections,
+                )
+            else:
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    headers=DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=self.max_connections),
+                )
+        return self._client
+
+    # ── Async API ──
+    async def get(self, url: str):
+        """
+        Sayfayı indirir, yanıt nesnesini döndürür (.text / .content).
+
+        Raises:
+            HttpStatusError: 4xx / 5xx yanıt (status_code ile)
+            ScraperException: bağlantı hatası
+        """
+        await self.rate_limiter.wait_if_needed_async(url)
+        logger.debug(f"HTTP GET: {url}")
+
+        try:
+            response = await self.client.get(url)
+        except HTTP_ERRORS as e:
+            raise ScraperException(f"HTTP isteği başarısız ({url}): {e}") from e
+
+        if response.status_code >= 400:
+            raise HttpStatusError(url, response.status_code)
+        return response
+
+    async def fetch(self, url: str) -> HTMLParser:
+        """Sayfayı indirir ve parse edilmiş HTML ağacını döndürür."""
+        response = await self.get(url)
+        return HTMLParser(response.text)
+
+    async def fetch_many(self, urls: List[str]) -> List[Optional[HTMLParser]]:
+        """Sayfaları aynı anda indirir; başarısız olanların yerinde None döner."""
+        results = await asyncio.gather(*(self.fetch(url) for url in urls), return_exceptions=True)
+
+        trees = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"HTTP hatası: {result}")
+                trees.append(None)
+            else:
+                trees.append(result)
+        return trees
+
+    # ── Senkron API ──
+    def fetch_html(self, url: str) -> HTMLParser:
+        """fetch()'in senkron hali (Selenium tabanlı scraper'lar içinden çağrılır)."""
+        return self._run(self.fetch(url))
+
+    def fetch_bytes(self, url: str) -> bytes:
+        """Ham yanıt gövdesi (parse etmeden substring araması için)."""
+        return self._run(self.get(url)).content
+
+    def _run(self, coro):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    # ── Kapatma ──
+    def close(self) -> None:
+        """Açık bağlantıları ve event loop'u kapatır."""
+        if self._client is not None:
+            # httpx: aclose(), curl_cffi: close() (ikisi de coroutine)
+            aclose = getattr(self._client, "aclose", None) or self._client.close
+            if self._loop is not None:
+                self._loop.run_until_complete(aclose())
+            else:
+                asyncio.run(aclose())
+            self._client = None
+
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
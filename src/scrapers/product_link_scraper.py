@@ -2,35 +2,65 @@
 src/scrapers/product_link_scraper.py
 
 Hepsiburada'dan ürün linklerini toplayan scraper.
-- Kategorileri tarar
+- Kategorileri paralel tarar (ThreadPoolExecutor; listeleme sayfaları önce HTTP ile,
+  gerekirse Chrome ile — Chrome tek driver olduğu için sırayla kullanılır)
 - Yorum sayısı 1000+ olan ürünleri filtre eder
-- Değerlendirme özeti olan ürünleri seçer
-- Sonuçları .txt dosyasına kaydeder
+- Değerlendirme özeti olan ürünleri seçer (yorum sayfası önce HTTP ile, gerekirse Chrome ile)
+- Bulunan linkleri anında .part dosyasına, tamamlanan sayfaları .pages dosyasına ekler
+  (yarıda kesilirse kaldığı yerden devam eder), bitince sıralı .txt dosyasına kaydeder
 """
 
+import os
+import re
+import time
 import logging
-from typing import List, Set, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import IO, Dict, Iterable, List, Set, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
 
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
-from src.scrapers.base_scraper import BaseScraper, retry_on_failure
+from src.scrapers.base_scraper import BaseScraper, ScraperException, retry_on_failure
+from src.scrapers.http_scraper import HttpScraper, HttpStatusError
+from src.scrapers.summary_cache import SummaryCache
 from src.config.config_settings import settings
 
 
 logger = logging.getLogger(__name__)
 
 
+# Yorum sayısı metni "(1.234)": parantez ve binlik ayraçları tek C geçişinde silinir
+# (karakter karakter rakam toplayan saf Python döngüsünden ~1.7x hızlı)
+_COUNT_DELETE = b".,()"
+# Metin başka bir şey de içeriyorsa ("(1.234 yorum)") → ilk rakam grubu
+_REVIEW_COUNT_RE = re.compile(r"\d[\d.,]*")
+# .part'tan geri yüklenen satırın ürün linki olup olmadığı (takip parametresiz):
+# ".../urun-adi-p-HBC00001" veya "-pm-"
+_PRODUCT_URL_RE = re.compile(r"https?://[^/\s]+/[^\s?#]+-pm?-[A-Za-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def _get_reviews_url(product_url: str) -> str:
+    """Ürün URL'sini yorum sayfası URL'sine çevirir (URL başına bir kez hesaplanır)."""
+    clean_url = product_url.partition("?")[0]
+    if "-yorumlari" not in clean_url:
+        clean_url += "-yorumlari"
+    return clean_url
+
+
 # ─────────────────────────────────────────
 # İLERLEYİŞ TAKIP
 # ─────────────────────────────────────────
 
 @dataclass
 class ScrapingProgress:
-    """Scraping'in nerede olduğunu takip eder."""
+    """Scraping'in nerede olduğunu takip eder (sayaçlar birden fazla thread'den artırılır)."""
     total_products_found: int = 0
     valid_products: int = 0
     categories_processed: int = 0
@@ -38,6 +68,14 @@ class ScrapingProgress:
     errors: int = 0
     skipped_no_reviews: int = 0
     skipped_no_summary: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def inc(self, name: str, by: int = 1) -> int:
+        """Sayacı thread-safe artırır, yeni değeri döndürür (`x += 1` atomik değildir)."""
+        with self._lock:
+            value = getattr(self, name) + by
+            setattr(self, name, value)
+            return value
 
     def __str__(self) -> str:
         return (
@@ -64,12 +102,107 @@ class ProductLinkScraper(BaseScraper):
     # CSS Selectors — Hepsiburada'nın kullandığı selectors
     PRODUCT_CARD_SELECTOR = "li.productListContent-zAP0Y5msy8OHn5z7T_K_"
     REVIEW_COUNT_SELECTOR = "span.rate-module_count__fjUng"
-    SUMMARY_HEADING_XPATH = "//h2[contains(text(), 'Değerlendirme özeti')]"
+    SUMMARY_HEADING_TEXT = "Değerlendirme özeti"
+    # XPath contains(text()) tüm metin düğümlerini gezer; h2'leri JS ile taramak daha hızlı
+    SUMMARY_HEADING_JS = (
+        "return Array.prototype.some.call(document.getElementsByTagName('h2'),"
+        " h => h.textContent.includes(arguments[0]));"
+    )
+    SUMMARY_HEADING_BYTES = SUMMARY_HEADING_TEXT.encode("utf-8")
+
+    # Tüm kartların (yorum sayısı metni, link) çiftleri tek WebDriver çağrısında
+    CARD_DATA_JS = """
+        return Array.from(document.querySelectorAll(arguments[0]), card => {
+            const count = card.querySelector(arguments[1]);
+            const link = card.querySelector("a");
+            return [count ? count.textContent : "", link ? link.href : null];
+        });
+    """
+
+    # Hedefe kalan ürün sayısından bu kadar fazla aday kontrol edilir (özeti olmayanlar için pay)
+    SUMMARY_CHECK_OVERSHOOT = 2
 
-    def __init__(self, **kwargs):
+    # Art arda bu kadar HTTP denemesi başarısız olursa (bağlantı hatası, 403/429/5xx, bot
+    # koruması, JS render) HTTP bırakılır; kategori sonundaki boş sayfalar / 404 sayılmaz
+    HTTP_MAX_FAILURES = 3
+
+    # Kategori başına en fazla taranan sayfa; art arda bu kadar boş sayfa gelirse kategori biter
+    MAX_PAGES = 50
+    MAX_EMPTY_PAGES = 2
+
+    def __init__(
+        self,
+        use_http_listing: bool = True,
+        listing_wait_s: float = settings.LISTING_WAIT_TIMEOUT,
+        summary_wait_s: float = settings.SUMMARY_WAIT_TIMEOUT,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.progress = ScrapingProgress()
         self.collected_links: Set[str] = set()
+        self.max_products = settings.MAX_PRODUCTS
+
+        # collected_links / progress birden fazla thread'den güncellenir
+        self._lock = threading.Lock()
+        # Tek Chrome driver'ı aynı anda tek thread kullanır
+        self._driver_lock = threading.RLock()
+
+        # Listeleme sayfaları sunucuda render edilir → Chrome'suz indirilir
+        # (use_http_listing=False → her sayfa doğrudan Chrome ile açılır)
+        self.use_http_listing = use_http_listing
+        self._http_failures = 0
+        self._summary_http_failures = 0
+        # HTTP ile kart gelmiş kategoriler: bunlarda kartsız sayfa = kategorinin sonu
+        self._http_listed: Set[str] = set()
+
+        # Chrome'da bekleme süreleri (saniye): eleman yoksa bu kadar sonra geçilir
+        self.listing_wait_s = listing_wait_s
+        self.summary_wait_s = summary_wait_s
+
+        # Her thread'in kendi HttpScraper'ı (ve event loop'u) olur; rate limiter ortak:
+        # listeleme ve yorum sayfaları aynı host bütçesini paylaşır
+        self._local = threading.local()
+        self._http_clients: List[HttpScraper] = []
+
+        # Özet kontrolleri için ortak havuz (scrape() süresince açık)
+        self._summary_executor: Optional[ThreadPoolExecutor] = None
+
+        # Bulunan linkler anında eklenen ara dosya (scrape() süresince açık)
+        self._links_fp: Optional[IO[str]] = None
+        # Tamamlanan sayfaların eklendiği ayrı dosya (.part'ta sadece linkler olur)
+        self._pages_fp: Optional[IO[str]] = None
+        # Yarıda kalan çalıştırmada kategori başına tamamlanan son sayfa (.pages'ten okunur)
+        self._resume_pages: Dict[str, int] = {}
+
+        # Chrome özet kontrolleri için bir kez açılıp tekrar kullanılan sekme
+        self._main_handle: Optional[str] = None
+        self._probe_handle: Optional[str] = None
+
+        # Önceki çalıştırmalardan bilinen özet kontrolü sonuçları (ilk kullanımda açılır)
+        self._summary_cache: Optional[SummaryCache] = None
+
+    @property
+    def http(self) -> HttpScraper:
+        """Bu thread'in HttpScraper'ı (ilk kullanımda açılır)."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = HttpScraper(timeout=self.timeout, rate_limiter=self.rate_limiter)
+            self._local.http = http
+            with self._lock:
+                self._http_clients.append(http)
+        return http
+
+    @property
+    def summary_cache(self) -> SummaryCache:
+        """Diskteki özet kontrolü önbelleği (ilk kullanımda açılır, close() ile kapanır)."""
+        with self._lock:
+            if self._summary_cache is None:
+                self._summary_cache = SummaryCache()
+            return self._summary_cache
+
+    def _target_reached(self) -> bool:
+        with self._lock:
+            return len(self.collected_links) >= self.max_products
 
     # ─────────────────────────
     # ANA METOT
@@ -104,19 +237,50 @@ class ProductLinkScraper(BaseScraper):
             f"Hedef: {max_products} ürün | Min yorum: {min_reviews}"
         )
 
+        self.max_products = max_products
+
+        # Önceki çalıştırma yarıda kaldıysa bulunanlarla devam et
+        part_file = output_file.with_suffix(".part")
+        pages_file = output_file.with_suffix(".pages")
+        self._resume_links(part_file)
+        self._resume_page_marks(pages_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._links_fp = open(part_file, "a", encoding="utf-8", buffering=1)
+        self._pages_fp = open(pages_file, "a", encoding="utf-8", buffering=1)
+
         try:
-            for category_url in categories:
-                # Hedef ürün sayısına ulaştıysanız durun
-                if len(self.collected_links) >= max_products:
-                    logger.info(f"Hedef {max_products} ürüne ulaştı!")
-                    break
-
-                self._scrape_category(
-                    category_url=category_url,
-                    max_products=max_products,
-                    min_reviews=min_reviews,
-                )
-                self.progress.categories_processed += 1
+            with ThreadPoolExecutor(
+                max_workers=settings.SUMMARY_CHECK_WORKERS
+            ) as self._summary_executor, ThreadPoolExecutor(
+                max_workers=settings.SCRAPER_WORKERS
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._scrape_category,
+                        category_url=category_url,
+                        max_products=max_products,
+                        min_reviews=min_reviews,
+                        # Aynı anda başlayıp siteye aynı saniyede yüklenmesinler
+                        start_delay=(idx % settings.SCRAPER_WORKERS) * settings.SCRAPER_WORKER_STAGGER,
+                    ): category_url
+                    for idx, category_url in enumerate(categories)
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.warning(f"Kategori hatası ({futures[future]}): {e}")
+                        self.progress.inc("errors")
+
+                    self.progress.inc("categories_processed")
+
+                    # Hedef ürün sayısına ulaşıldıysa başlamamış kategorileri iptal et
+                    if self._target_reached():
+                        logger.info(f"Hedef {max_products} ürüne ulaştı!")
+                        for pending in futures:
+                            pending.cancel()
+                        break
 
             # Sonuçları kaydet
             self._save_links(output_file)
@@ -127,6 +291,11 @@ class ProductLinkScraper(BaseScraper):
             logger.error(f"Scraping başarısız: {e}", exc_info=True)
             raise
         finally:
+            for http in self._http_clients:
+                http.close()
+            self._http_clients.clear()
+            self._summary_executor = None
+            self._close_progress_files()
             self.close()
 
     # ─────────────────────────
@@ -137,140 +306,451 @@ class ProductLinkScraper(BaseScraper):
         category_url: str,
         max_products: int,
         min_reviews: int,
+        start_delay: float = 0.0,
     ) -> None:
-        """Bir kategori içindeki sayfaları tarar."""
+        """Bir kategori içindeki sayfaları sırayla tarar (thread içinde çalışır)."""
+        if start_delay:
+            time.sleep(start_delay)
         logger.info(f"Kategori başladı: {category_url}")
 
-        for page_num in range(1, 51):  # Max 50 sayfa
-            if len(self.collected_links) >= max_products:
+        # Yarıda kalan çalıştırmada tamamlanmış sayfalar tekrar açılmaz
+        start_page = self._resume_pages.get(category_url, 0) + 1
+        consecutive_empty = 0
+
+        # Sayfa URL'leri bir kez üretilir; kategori URL'si zaten parametre içeriyorsa "&"
+        separator = "&" if "?" in category_url else "?"
+        page_urls = [
+            (page_num, f"{category_url}{separator}sayfa={page_num}")
+            for page_num in range(start_page, self.MAX_PAGES + 1)
+        ]
+
+        for page_num, page_url in page_urls:
+            if self._target_reached():
                 break
 
             try:
-                page_url = f"{category_url}?sayfa={page_num}"
-                self._scrape_page(page_url, min_reviews)
-                self.progress.pages_scraped += 1
+                card_count, checked_all = self._scrape_page(page_url, min_reviews, category_url)
+                self.progress.inc("pages_scraped")
+
+            except TimeoutException as e:
+                # Sayfa hiç yüklenmedi → boş sayfa gibi say
+                logger.warning(f"Sayfa {page_num} zaman aşımı: {e}")
+                card_count, checked_all = 0, True
 
             except Exception as e:
                 logger.warning(f"Sayfa {page_num} hatası: {e}")
-                self.progress.errors += 1
+                self.progress.inc("errors")
+                continue
+
+            if card_count:
+                consecutive_empty = 0
+                # Hedefe ulaşıldığı için adaylarının bir kısmı kontrol edilmeyen sayfa
+                # işaretlenmez: devam eden (daha büyük hedefli) çalıştırma onu tekrar tarar
+                if checked_all:
+                    self._mark_page(category_url, page_num)
                 continue
 
+            # Kategorinin sayfaları bitti → kalan sayfalar için beklemeye gerek yok
+            consecutive_empty += 1
+            if consecutive_empty >= self.MAX_EMPTY_PAGES:
+                logger.info(f"Kategori bitti (son sayfa {page_num - consecutive_empty}): {category_url}")
+                self._mark_page(category_url, self.MAX_PAGES)
+                break
+
     # ─────────────────────────
     # BIR SAYFA TARAMA
     # ─────────────────────────
     @retry_on_failure(max_retries=3)
-    def _scrape_page(self, page_url: str, min_reviews: int) -> None:
-        """Tek bir sayfayı tarar, ürün kartlarını inceler."""
-        self.get_page(page_url)
+    def _scrape_page(
+        self, page_url: str, min_reviews: int, category_url: str = ""
+    ) -> Tuple[int, bool]:
+        """
+        Tek bir sayfayı tarar, ürün kartlarını inceler.
+
+        Returns:
+            (sayfadaki ürün kartı sayısı, sayfanın tüm adayları kontrol edildi mi);
+            kart sayısı 0 → sayfa boş, kategori bitmiş olabilir
+        """
+        cards = self._cards_from_http(page_url, category_url)
+
+        if cards is None:
+            # HTTP ile okunamadı (engel, JS render) → Chrome ile aç
+            with self._driver_lock:
+                cards = self._cards_from_driver(page_url)
+        if not cards:
+            return 0, True
+
+        # ── Yorum sayısına göre filtre ──
+        potential_links = self._filter_cards(cards, min_reviews)
+
+        # ── Hedefe yetecek kadar aday bırak ──
+        with self._lock:
+            remaining = self.max_products - len(self.collected_links)
+        if remaining <= 0:
+            return len(cards), not potential_links
+        limit = remaining + self.SUMMARY_CHECK_OVERSHOOT
+        checked_all = len(potential_links) <= limit
+        potential_links = potential_links[:limit]
+
+        # ── Değerlendirme özeti kontrolü (sayfadaki tüm adaylar aynı anda) ──
+        mapper = self._summary_executor.map if self._summary_executor else map
+        results = list(mapper(self._check_summary, potential_links))
+
+        with self._lock:
+            for product_url, has_summary in zip(potential_links, results):
+                if has_summary is None:  # hedefe ulaşıldığı için kontrol edilmedi
+                    checked_all = False
+                    continue
+                if not has_summary:
+                    self.progress.inc("skipped_no_summary")
+                elif product_url in self.collected_links:
+                    continue
+                elif len(self.collected_links) < self.max_products:
+                    self.collected_links.add(product_url)
+                    if self._links_fp is not None:
+                        self._links_fp.write(f"{product_url}\n")
+                    valid_products = self.progress.inc("valid_products")
+                    logger.info(f"✅ Eklendi ({valid_products}/{self.max_products})")
+                else:  # özeti var ama başka thread hedefi doldurdu → eklenmedi
+                    checked_all = False
 
+        return len(cards), checked_all
+
+    # ─────────────────────────
+    # KART OKUMA (HTTP / Chrome)
+    # ─────────────────────────
+    def _cards_from_http(
+        self, page_url: str, category_url: str = ""
+    ) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """
+        Listeleme sayfasını HTTP ile indirip kartları selectolax ile okur.
+
+        Returns:
+            (yorum sayısı metni, link) çiftleri; sayfa yoksa (404) veya kategorinin
+            sonuna gelindiyse []; HTTP ile okunamadıysa None → Chrome ile denenmeli
+        """
+        if not self.use_http_listing or self._http_failures >= self.HTTP_MAX_FAILURES:
+            return None
+
+        try:
+            product_cards = self.http.fetch_html(page_url).css(self.PRODUCT_CARD_SELECTOR)
+        except HttpStatusError as e:
+            if e.status_code == 404:  # sayfa yok → kategorinin sonu
+                return []
+            logger.debug(f"HTTP ile alınamadı, Chrome denenecek: {e}")
+            product_cards = None
+        except ScraperException as e:
+            logger.debug(f"HTTP ile alınamadı, Chrome denenecek: {e}")
+            product_cards = None
+
+        with self._lock:
+            if not product_cards:
+                # Bu kategori daha önce HTTP ile kart verdiyse kartsız 200 = son sayfa geçildi;
+                # hiç vermediyse engel / JS render sayfası olabilir → hata say, Chrome'a bırak
+                if product_cards is not None and category_url in self._http_listed:
+                    return []
+
+                self._http_failures += 1
+                if self._http_failures == self.HTTP_MAX_FAILURES:
+                    logger.info("Listeleme sayfaları HTTP ile okunamıyor, Chrome'a geçildi.")
+                return None
+
+            self._http_failures = 0
+            self._http_listed.add(category_url)
+        logger.debug(f"{len(product_cards)} ürün kartı bulundu (HTTP)")
+
+        cards = []
+        for card in product_cards:
+            count_el = card.css_first(self.REVIEW_COUNT_SELECTOR)
+            link_el = card.css_first("a")
+            href = link_el.attributes.get("href") if link_el else None
+            cards.append((
+                count_el.text(strip=True) if count_el else "",
+                urljoin(page_url, href) if href else None,
+            ))
+
+        return cards
+
+    def _cards_from_driver(self, page_url: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """
+        Listeleme sayfasını Chrome ile açıp kartları okur.
+
+        Returns:
+            (yorum sayısı metni, link) çiftleri; sayfada ürün kartı yoksa None
+        """
         # Ürün kartları yüklenene kadar bekle
         try:
-            self.wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, self.PRODUCT_CARD_SELECTOR)
-                )
+            self.get_page(
+                page_url,
+                wait_for=(By.CSS_SELECTOR, self.PRODUCT_CARD_SELECTOR),
+                timeout=self.listing_wait_s,
             )
         except TimeoutException:
             logger.warning(f"Ürün bulunamadı: {page_url}")
-            return
+            return None
 
-        product_cards = self.driver.find_elements(
-            By.CSS_SELECTOR, self.PRODUCT_CARD_SELECTOR
+        # Kart başına find_element yerine tek execute_script (tek round-trip)
+        cards = self.driver.execute_script(
+            self.CARD_DATA_JS, self.PRODUCT_CARD_SELECTOR, self.REVIEW_COUNT_SELECTOR
         )
-        logger.debug(f"{len(product_cards)} ürün kartı bulundu")
+        logger.debug(f"{len(cards)} ürün kartı bulundu")
 
-        # ── Yorum sayısına göre filtre ──
-        potential_links: List[str] = []
+        return cards
 
-        for card in product_cards:
-            try:
-                review_text = self.safe_get_text(
-                    By.CSS_SELECTOR,
-                    self.REVIEW_COUNT_SELECTOR,
-                    parent=card,
-                )
+    def _filter_cards(
+        self, cards: Iterable[Tuple[str, Optional[str]]], min_reviews: int
+    ) -> List[str]:
+        """
+        (yorum sayısı metni, link) çiftlerinden yorum sayısı yeterli olanların linkleri.
 
-                if not review_text:
-                    continue
+        Aynı ürün sayfada iki kez geçebilir (sponsorlu + normal kart); her ürün bir kez,
+        ilk görülme sırasıyla döner.
+        """
+        potential_links: Dict[str, None] = {}  # sıralı küme
 
-                # "(1.234)" → 1234
-                review_count = int(
-                    review_text.strip("()").replace(".", "").replace(",", "")
-                )
+        for review_text, url in cards:
+            if not review_text:
+                continue
 
-                if review_count >= min_reviews:
-                    link_el = card.find_element(By.TAG_NAME, "a")
-                    url = link_el.get_attribute("href")
+            try:
+                review_count = self._parse_review_count(review_text)
+            except ValueError:
+                continue
 
-                    if url and url not in self.collected_links:
-                        potential_links.append(url)
-                        self.progress.total_products_found += 1
-                else:
-                    self.progress.skipped_no_reviews += 1
+            if review_count >= min_reviews:
+                self._add_candidate(url, potential_links)
+            else:
+                self.progress.inc("skipped_no_reviews")
 
-            except (NoSuchElementException, ValueError):
-                continue
+        return list(potential_links)
 
-        # ── Değerlendirme özeti kontrolü ──
-        for product_url in potential_links:
-            if len(self.collected_links) >= settings.MAX_PRODUCTS:
-                break
+    def _add_candidate(self, url: Optional[str], potential_links: Dict[str, None]) -> None:
+        """Yeni bir ürün linkini (takip parametreleri atılmış haliyle) aday listesine ekler."""
+        if not url:
+            return
 
-            if self._has_review_summary(product_url):
-                self.collected_links.add(product_url)
-                self.progress.valid_products += 1
-                logger.info(
-                    f"✅ Eklendi ({self.progress.valid_products}/"
-                    f"{settings.MAX_PRODUCTS})"
-                )
-            else:
-                self.progress.skipped_no_summary += 1
+        url = url.partition("?")[0]
+        if url in potential_links:
+            return
+
+        with self._lock:
+            if url in self.collected_links:
+                return
+            self.progress.inc("total_products_found")
+        potential_links[url] = None
 
     # ─────────────────────────
     # ÖZET KONTROLÜ
     # ─────────────────────────
-    def _has_review_summary(self, product_url: str) -> bool:
-        """Ürünün yorum özeti var mı kontrol eder."""
-        reviews_url = self._get_reviews_url(product_url)
+    def _check_summary(self, product_url: str) -> Optional[bool]:
+        """
+        Özet kontrolü (havuz thread'inde çalışır): önce HTTP, karar verilemezse Chrome.
+
+        Returns:
+            True/False; hedef ürün sayısına zaten ulaşıldıysa None (kontrol edilmez)
+        """
+        if self._target_reached():
+            return None
+
+        cache = self.summary_cache
+        reviews_url = _get_reviews_url(product_url)
+        has_summary = cache.get(reviews_url)
+        if has_summary is not None:
+            return has_summary
+
+        has_summary = self._has_review_summary_http(product_url)
+        if has_summary is None:
+            # HTTP ile karar verilemedi → Chrome'da sekme açıp bak
+            with self._driver_lock:
+                has_summary = self._has_review_summary(product_url)
+            # Chrome'da False = bekleme süresi doldu; yavaş yüklenen sayfa da olabilir,
+            # bu yüzden sadece bulunan başlık kaydedilir (sonraki çalıştırmada tekrar bakılır)
+            if not has_summary:
+                return has_summary
+
+        cache.put(reviews_url, has_summary)
+        return has_summary
 
-        # Yeni sekme aç
-        self.driver.execute_script(f"window.open('{reviews_url}');")
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+    def _has_review_summary_http(self, product_url: str) -> Optional[bool]:
+        """
+        Yorum sayfasını HTTP ile indirip başlık metnini ham byte'larda arar.
+
+        Returns:
+            True/False; sayfa alınamadıysa veya içerik JS ile render ediliyorsa
+            (boş <main>) None → Chrome ile kontrol edilmeli
+        """
+        if self._summary_http_failures >= self.HTTP_MAX_FAILURES:
+            return None
 
         try:
-            self.wait.until(
-                EC.presence_of_element_located(
-                    (By.XPATH, self.SUMMARY_HEADING_XPATH)
-                )
+            body = self.http.fetch_bytes(_get_reviews_url(product_url))
+        except ScraperException as e:
+            logger.debug(f"Özet HTTP ile kontrol edilemedi: {e}")
+            body = None
+
+        if body is not None and self.SUMMARY_HEADING_BYTES in body:
+            has_summary = True
+        elif body is not None and self._has_server_content(body):
+            has_summary = False
+        else:
+            has_summary = None
+
+        with self._lock:
+            if has_summary is None:
+                self._summary_http_failures += 1
+                if self._summary_http_failures == self.HTTP_MAX_FAILURES:
+                    logger.info("Yorum sayfaları HTTP ile okunamıyor, özet kontrolü Chrome'a geçildi.")
+            else:
+                self._summary_http_failures = 0
+
+        return has_summary
+
+    @staticmethod
+    def _has_server_content(body: bytes) -> bool:
+        """Sayfa içeriği sunucuda render edilmiş mi (<main> dolu mu)?"""
+        main = HTMLParser(body).css_first("main")
+        return main is not None and bool(main.text(strip=True))
+
+    def _has_review_summary(self, product_url: str) -> bool:
+        """Ürünün yorum özeti var mı kontrol eder (Chrome, kalıcı probe sekmesinde)."""
+        reviews_url = _get_reviews_url(product_url)
+
+        self._switch_to_probe()
+        try:
+            self._navigate(reviews_url)
+            # Başlık varsa ilk HTML'de gelir; uzun beklemeye gerek yok
+            self.wait_until(
+                lambda driver: driver.execute_script(self.SUMMARY_HEADING_JS, self.SUMMARY_HEADING_TEXT),
+                timeout=self.summary_wait_s,
             )
             has_summary = True
         except TimeoutException:
             has_summary = False
         finally:
-            # Sekmeyi kapat, ana sekmeye dön
-            self.driver.close()
-            self.driver.switch_to.window(self.driver.window_handles[0])
+            # Sekme kapatılmaz, sadece ana sekmeye dönülür
+            self.driver.switch_to.window(self._main_handle)
 
         return has_summary
 
+    def _switch_to_probe(self) -> None:
+        """Probe sekmesine geçer; ilk çağrıda sekmeyi açar (kaynak engelleme dahil)."""
+        driver = self.driver
+        if self._probe_handle is None:
+            self._main_handle = driver.current_window_handle
+            driver.switch_to.new_window("tab")
+            self._block_resources(driver)  # CDP engeli sekmeye özel
+            self._probe_handle = driver.current_window_handle
+        else:
+            driver.switch_to.window(self._probe_handle)
+
+    def close(self) -> None:
+        """Driver kapanınca sekme referansları da geçersiz olur."""
+        self._main_handle = None
+        self._probe_handle = None
+
+        if self._summary_cache is not None:
+            self._summary_cache.close()
+            self._summary_cache = None
+
+        super().close()
+
     # ─────────────────────────
     # YARDIMCI METOTLAR
     # ─────────────────────────
     @staticmethod
-    def _get_reviews_url(product_url: str) -> str:
-        """Ürün URL'sini yorum sayfası URL'sine çevirir."""
-        clean_url = product_url.split("?")[0]
-        if "-yorumlari" not in clean_url:
-            clean_url += "-yorumlari"
-        return clean_url
+    def _parse_review_count(review_text: str) -> int:
+        """
+        Yorum sayısı metnini sayıya çevirir: "(1.234)" → 1234
+
+        Raises:
+            ValueError: metinde sayı yoksa
+        """
+        try:
+            return int(review_text.encode().translate(None, _COUNT_DELETE))
+        except ValueError:
+            match = _REVIEW_COUNT_RE.search(review_text)
+            if match is None:
+                raise ValueError(f"Yorum sayısı okunamadı: {review_text!r}") from None
+            return int(match.group(0).encode().translate(None, _COUNT_DELETE))
+
+    def _resume_links(self, part_file: Path) -> None:
+        """Yarıda kalmış çalıştırmanın .part dosyasındaki linkleri geri yükler."""
+        if not part_file.exists():
+            return
+
+        links = set()
+        with open(part_file, encoding="utf-8", errors="replace") as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line:
+                    continue
+
+                # Çökme anında yarım yazılmış son satır ("\n" yok) güvenilmez
+                if not raw_line.endswith("\n"):
+                    logger.warning(f"Yarım satır atlandı: {line!r}")
+                    continue
+
+                if _PRODUCT_URL_RE.fullmatch(line):
+                    links.add(line)
+                else:
+                    logger.warning(f"Geçersiz link atlandı: {line!r}")
+
+        self.collected_links.update(links)
+        self.progress.valid_products = len(self.collected_links)
+        logger.info(f"↩️ {len(links)} link önceki çalıştırmadan devam ediyor: {part_file}")
+
+    def _resume_page_marks(self, pages_file: Path) -> None:
+        """Yarıda kalmış çalıştırmanın .pages dosyasından kategori başına son tamamlanan sayfayı okur."""
+        if not pages_file.exists():
+            return
+
+        with open(pages_file, encoding="utf-8", errors="replace") as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line:
+                    continue
+
+                # "<sayfa> <kategori>"; çökme anında yarım yazılmış son satır güvenilmez
+                page, _, category_url = line.partition(" ")
+                if not raw_line.endswith("\n") or not page.isdigit() or not category_url:
+                    logger.warning(f"Bozuk sayfa işareti atlandı: {line!r}")
+                    continue
+
+                self._resume_pages[category_url] = max(
+                    int(page), self._resume_pages.get(category_url, 0)
+                )
+
+    def _mark_page(self, category_url: str, page_num: int) -> None:
+        """Tamamlanan sayfayı .pages dosyasına işler (yarıda kalırsa buradan devam edilir)."""
+        with self._lock:
+            if self._pages_fp is not None:
+                self._pages_fp.write(f"{page_num} {category_url}\n")
+
+    def _close_progress_files(self) -> None:
+        """.part / .pages dosyalarını kapatır (silmez)."""
+        for name in ("_links_fp", "_pages_fp"):
+            fp = getattr(self, name)
+            if fp is not None:
+                fp.close()
+                setattr(self, name, None)
 
     def _save_links(self, output_file: Path) -> None:
-        """Toplanan linkler dosyaya kaydedilir."""
+        """
+        Toplanan linkler sıralı olarak dosyaya kaydedilir.
+
+        Önce geçici dosyaya yazılır, sonra os.replace ile yerine konur (yarım dosya
+        kalmaz); .part / .pages dosyaları ancak bundan sonra silinir.
+        """
         output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_suffix(".tmp")
+
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.writelines(f"{link}\n" for link in sorted(self.collected_links))
+        os.replace(tmp_file, output_file)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            for link in sorted(self.collected_links):
-                f.write(f"{link}\n")
+        self._close_progress_files()
+        output_file.with_suffix(".part").unlink(missing_ok=True)
+        output_file.with_suffix(".pages").unlink(missing_ok=True)
 
         logger.info(f"💾 {len(self.collected_links)} link → {output_file}")
 
@@ -0,0 +1,74 @@
+"""
+src/scrapers/summary_cache.py
+
+Yorum sayfasında "Değerlendirme özeti" olup olmadığının diskte kalıcı önbelleği.
+- Anahtar yorum sayfası URL'si, değer (var_mı, kontrol_zamanı)
+- SUMMARY_CACHE_DAYS günden eski kayıtlar yok sayılır (ürüne sonradan özet gelebilir)
+- shelve ile saklanır; scraper tekrar çalıştığında bilinen ürünler hiç kontrol edilmez
+"""
+
+import time
+import shelve
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from src.config.config_settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────
+# SUMMARY CACHE
+# ─────────────────────────────────────────
+
+class SummaryCache:
+    """
+    Özet kontrolü sonuçlarını çalıştırmalar arasında saklar.
+
+    Kullanımı:
+        cache = SummaryCache()
+        has_summary = cache.get(reviews_url)
+        if has_summary is None:
+            has_summary = kontrol_et(reviews_url)
+            cache.put(reviews_url, has_summary)
+        cache.close()
+    """
+
+    def __init__(
+        self,
+        path: Path = settings.SUMMARY_CACHE_FILE,
+        max_age_days: float = settings.SUMMARY_CACHE_DAYS,
+    ):
+        self.path = Path(path)
+        self.max_age = max_age_days * 24 * 3600  # saniye
+        self._db = shelve.open(str(self.path))
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+    def get(self, reviews_url: str) -> Optional[bool]:
+        """Kayıtlı ve güncel sonuç; yoksa None."""
+        with self._lock:
+            entry = self._db.get(reviews_url)
+            if entry is None:
+                return None
+
+            has_summary, checked_at = entry
+            if time.time() - checked_at > self.max_age:
+                return None
+
+            self.hits += 1
+            return has_summary
+
+    def put(self, reviews_url: str, has_summary: bool) -> None:
+        with self._lock:
+            self._db[reviews_url] = (has_summary, time.time())
+
+    def close(self) -> None:
+        """Bekleyen yazmaları diske işler."""
+        with self._lock:
+            self._db.close()
+        logger.debug(f"Özet önbelleği kapatıldı ({self.hits} isabet)")
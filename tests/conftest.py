@@ -0,0 +1,35 @@
+"""Testlerde ortak fixture'lar."""
+
+import pytest
+
+
+class FakeTime:
+    """time modülü yerine: monotonic() elle ilerler, sleep() saati ilerletir."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Verilen modülün `time`'ını sahte saatle değiştirir, saati döndürür.
+
+    Kullanımı:
+        clock = fake_clock(rate_limit)
+        clock.now += 0.5
+    """
+    def patch(module) -> FakeTime:
+        clock = FakeTime()
+        monkeypatch.setattr(module, "time", clock)
+        return clock
+
+    return patch
@@ -0,0 +1,84 @@
+"""src/ai_analysis/ai_analysis.py — chunk paketleme ve model yanıtı JSON okuma."""
+
+import json
+
+import pytest
+
+from src.ai_analysis.ai_analysis import ReviewSummarizer, _parse_json
+from src.ai_analysis.rate_limit import estimate_tokens
+
+
+# ── _split_chunks ──
+@pytest.fixture
+def summarizer():
+    # Chunk paketleme LLM'e gitmez
+    return ReviewSummarizer(llm_client=None)
+
+
+def _chunk_tokens(summarizer, chunk):
+    return sum(estimate_tokens(summarizer.chunk_model, review) + 1 for review in chunk)
+
+
+def test_split_chunks_respects_token_budget(summarizer):
+    summarizer.token_budget = summarizer._prompt_overhead + 100
+    reviews = [f"yorum {i} " * 5 for i in range(40)]
+
+    chunks = summarizer._split_chunks(reviews)
+
+    assert len(chunks) > 1
+    assert [review for chunk in chunks for review in chunk] == reviews  # sıra korunur
+    for chunk in chunks:
+        assert _chunk_tokens(summarizer, chunk) <= 100
+
+
+def test_split_chunks_respects_chunk_size(summarizer):
+    summarizer.chunk_size = 3
+    chunks = summarizer._split_chunks(["iyi"] * 7)
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+
+def test_split_chunks_truncates_oversized_review(summarizer):
+    summarizer.token_budget = summarizer._prompt_overhead + 50
+    long_review = "çok uzun bir yorum " * 200
+
+    chunks = summarizer._split_chunks(["kısa", long_review, "son"])
+
+    assert chunks[0] == ["kısa"]
+    assert len(chunks[1]) == 1 and long_review.startswith(chunks[1][0])
+    assert _chunk_tokens(summarizer, chunks[1]) <= 50
+    assert chunks[2] == ["son"]
+
+
+def test_split_chunks_empty(summarizer):
+    assert summarizer._split_chunks([]) == []
+
+
+# ── _parse_json ──
+PAYLOAD = {"overall_summary": "İyi", "positive_aspects": ["kargo"], "sentiment": "Olumlu"}
+
+
+def test_parse_json_plain():
+    assert _parse_json(json.dumps(PAYLOAD, ensure_ascii=False)) == PAYLOAD
+
+
+def test_parse_json_markdown_block():
+    raw = "```json\n" + json.dumps(PAYLOAD, ensure_ascii=False) + "\n```"
+    assert _parse_json(raw) == PAYLOAD
+
+
+def test_parse_json_surrounding_text():
+    raw = "İşte özet:\n" + json.dumps(PAYLOAD, ensure_ascii=False) + "\nUmarım yardımcı olur."
+    assert _parse_json(raw) == PAYLOAD
+
+
+def test_parse_json_nested_object():
+    # Fallback regex'i bir seviye iç içe nesneyi kapsar
+    nested = {"G1": "a", "meta": {"count": 2}}
+    raw = "Yanıt: " + json.dumps(nested)
+    assert _parse_json(raw) == nested
+
+
+@pytest.mark.parametrize("raw", ["JSON yok", "", '{"overall_summary": "yarım'])
+def test_parse_json_raises_without_object(raw):
+    with pytest.raises(json.JSONDecodeError):
+        _parse_json(raw)
@@ -0,0 +1,59 @@
+"""src/scrapers/base_scraper.py — host başına RateLimiter (sahte saatle)."""
+
+import pytest
+
+from src.scrapers import base_scraper
+from src.scrapers.base_scraper import RateLimiter
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(base_scraper)
+
+
+URL = "https://www.hepsiburada.com/ara?q=kilif"
+
+
+def test_burst_then_rate(clock):
+    limiter = RateLimiter(max_requests=30, time_window=60, burst=2)  # 0.5 istek / sn
+
+    assert limiter._reserve(URL) == 0.0
+    assert limiter._reserve(URL) == 0.0
+    # Kova boş: sıradaki istekler 2 sn arayla sıraya girer
+    assert limiter._reserve(URL) == pytest.approx(2.0)
+    assert limiter._reserve(URL) == pytest.approx(4.0)
+
+
+def test_refill_capped_at_burst(clock):
+    limiter = RateLimiter(max_requests=30, time_window=60, burst=2)
+    limiter._reserve(URL)
+    limiter._reserve(URL)
+
+    clock.now += 600  # uzun boşluk sadece burst kadar birikir
+    assert limiter._reserve(URL) == 0.0
+    assert limiter._reserve(URL) == 0.0
+    assert limiter._reserve(URL) == pytest.approx(2.0)
+
+
+def test_partial_refill(clock):
+    limiter = RateLimiter(max_requests=60, time_window=60, burst=1)  # 1 istek / sn
+    assert limiter._reserve(URL) == 0.0
+
+    clock.now += 0.25
+    assert limiter._reserve(URL) == pytest.approx(0.75)
+
+
+def test_hosts_have_separate_buckets(clock):
+    limiter = RateLimiter(max_requests=60, time_window=60, burst=1)
+    assert limiter._reserve("https://a.example.com/x") == 0.0
+    assert limiter._reserve("https://b.example.com/x") == 0.0
+    assert limiter._reserve("https://a.example.com/y") == pytest.approx(1.0)
+
+
+def test_wait_if_needed_sleeps_reserved_time(clock):
+    limiter = RateLimiter(max_requests=60, time_window=60, burst=1)
+    limiter.wait_if_needed(URL)
+    assert clock.sleeps == []
+
+    limiter.wait_if_needed(URL)
+    assert clock.sleeps == [pytest.approx(1.0)]
@@ -0,0 +1,89 @@
+"""src/data_processing/dashboard_data.py — fiyat / yorum / AI önceliği türetme."""
+
+import pandas as pd
+import pytest
+
+from src.data_processing.dashboard_data import PRICE_ORDER, has_valid_ai, preprocess
+
+
+VALID_AI = "Kullanıcılar kargonun hızlı, paketlemenin özenli olduğunu belirtiyor."
+
+
+# ── has_valid_ai ──
+def test_has_valid_ai():
+    col = pd.Series([
+        VALID_AI,
+        None,
+        "",
+        "kısa özet",
+        "Error code: 400 - {'error': {'code': 'context_length_exceeded'}}",
+        "Analiz hatası: context_length_exceeded, model sınırı aşıldı",
+    ])
+    result = has_valid_ai(col)
+
+    assert result.tolist() == [1, 0, 0, 0, 0, 0]
+    assert result.dtype == "int8"
+
+
+def test_has_valid_ai_length_boundary():
+    assert has_valid_ai(pd.Series(["a" * 20, "a" * 21])).tolist() == [0, 1]
+
+
+# ── preprocess ──
+@pytest.fixture
+def raw_products():
+    return pd.DataFrame({
+        "urun_id": ["HB1", "HB2", "HB3", "HB4"],
+        "urun_adi": ["Kılıf", "Kulaklık", "Telefon", "Kablo"],
+        "fiyat": ["1.149,90 TL", "99 TL", "25.000 TL", "fiyat yok"],
+        "ortalama_star_puani": [4.5, 3.0, 4.8, 2.1],
+        "5star": [10, 1, 100, 0],
+        "4star": [5, 2, 20, 0],
+        "3star": [1, 3, 5, 1],
+        "2star": [0, 1, 1, 2],
+        "1star": [0, 4, 2, 3],
+        "ai_ozet": [VALID_AI, None, "Error code: 429", VALID_AI],
+    })
+
+
+def test_preprocess_parses_prices(raw_products):
+    df = preprocess(raw_products)
+    assert df["fiyat_num"].tolist() == pytest.approx([1149.90, 99.0, 25000.0, 0.0])
+
+
+def test_preprocess_review_totals_and_ai_priority(raw_products):
+    df = preprocess(raw_products)
+    assert df["toplam_yorum"].tolist() == [16, 11, 128, 6]
+    assert df["ai_priority"].tolist() == [1, 0, 0, 1]
+
+
+def test_preprocess_missing_optional_columns():
+    df = preprocess(pd.DataFrame({
+        "urun_id": ["HB1"], "urun_adi": ["Kılıf"], "fiyat": ["10 TL"], "ortalama_star_puani": [4.0],
+    }))
+    assert df["toplam_yorum"].tolist() == [0]
+    assert df["ai_priority"].tolist() == [0]
+    assert df["yorum_ozeti"].isna().all()
+
+
+def test_preprocess_dtypes(raw_products):
+    df = preprocess(raw_products)
+    assert df["toplam_yorum"].dtype == "int32"
+    assert df["5star"].dtype == "int32"
+    assert df["ortalama_star_puani"].dtype == "float32"
+    assert df["ai_priority"].dtype == "int8"
+    assert df["urun_adi"].dtype == "string[pyarrow]"
+
+
+def test_preprocess_price_ranges(raw_products):
+    df = preprocess(raw_products)
+    assert df["fiyat_araligi"].tolist() == [PRICE_ORDER[3], PRICE_ORDER[0], PRICE_ORDER[4], PRICE_ORDER[0]]
+    assert list(df["fiyat_araligi"].cat.categories) == PRICE_ORDER
+
+
+def test_preprocess_price_range_boundaries():
+    df = pd.DataFrame({
+        "urun_id": ["a"] * 5, "urun_adi": ["a"] * 5, "ortalama_star_puani": [1.0] * 5,
+        "fiyat": ["99,99 TL", "100 TL", "500 TL", "1.000 TL", "5.000 TL"],
+    })
+    assert preprocess(df)["fiyat_araligi"].tolist() == PRICE_ORDER
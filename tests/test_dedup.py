@@ -0,0 +1,64 @@
+"""src/ai_analysis/dedup.py — MinHash / LSH ile tekrar eden yorum gruplama."""
+
+import numpy as np
+
+from src.ai_analysis import dedup
+from src.ai_analysis.dedup import group_near_duplicates
+
+
+BASE = "ürün çok güzel geldi, kargo hızlıydı, paketleme özenliydi, herkese tavsiye ederim"
+NEAR = "ürün çok güzel geldi kargo da hızlıydı, paketleme özenliydi, herkese tavsiye ederim"
+
+
+def _agreement(a: str, b: str) -> float:
+    sig_a = dedup._signature(dedup._normalize(a))
+    sig_b = dedup._signature(dedup._normalize(b))
+    return float((sig_a == sig_b).mean())
+
+
+def _share_band(a: str, b: str) -> bool:
+    rows = dedup.NUM_PERM // dedup.LSH_BANDS
+    sig_a = dedup._signature(dedup._normalize(a)).reshape(dedup.LSH_BANDS, rows)
+    sig_b = dedup._signature(dedup._normalize(b)).reshape(dedup.LSH_BANDS, rows)
+    return bool((sig_a == sig_b).all(axis=1).any())
+
+
+def test_identical_reviews_collapse_to_first():
+    texts = ["Süper ürün!!", "ikinci yorum bambaşka", "süper   ürün", "SÜPER ÜRÜN."]
+    assert group_near_duplicates(texts) == [(0, 3), (1, 1)]
+
+
+def test_near_identical_reviews_grouped():
+    assert group_near_duplicates([BASE, NEAR], threshold=0.5) == [(0, 2)]
+
+
+def test_disjoint_reviews_kept_apart():
+    texts = [
+        "telefon kılıfı tam oturdu, kenarları sağlam",
+        "kulaklığın bas sesi zayıf, mikrofon cızırtılı",
+        "şarj kablosu iki haftada bozuldu",
+    ]
+    assert group_near_duplicates(texts) == [(0, 1), (1, 1), (2, 1)]
+
+
+def test_empty_input():
+    assert group_near_duplicates([]) == []
+
+
+def test_threshold_boundary():
+    # Aynı LSH bandına düşen çiftte karar sadece imza benzerliği ile eşiğe göre verilir
+    assert _share_band(BASE, NEAR)
+    agreement = _agreement(BASE, NEAR)
+    assert 0 < agreement < 1
+
+    # Eşik dahil: benzerlik == eşik → aynı grup
+    assert group_near_duplicates([BASE, NEAR], threshold=agreement) == [(0, 2)]
+    # Bir permütasyon fazlası istenirse ayrı gruplar
+    above = agreement + 1 / dedup.NUM_PERM
+    assert group_near_duplicates([BASE, NEAR], threshold=above) == [(0, 1), (1, 1)]
+
+
+def test_signature_is_deterministic():
+    sig = dedup._signature(dedup._normalize(BASE))
+    assert sig.shape == (dedup.NUM_PERM,)
+    np.testing.assert_array_equal(sig, dedup._signature(dedup._normalize(BASE)))
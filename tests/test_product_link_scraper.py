@@ -0,0 +1,105 @@
+"""src/scrapers/product_link_scraper.py — yorum sayısı okuma ve yarıda kalan çalıştırmadan devam."""
+
+import pytest
+
+from src.scrapers.product_link_scraper import ProductLinkScraper
+
+
+LINK_A = "https://www.hepsiburada.com/telefon-kilifi-p-HBC00001ABCD"
+LINK_B = "https://www.hepsiburada.com/kulaklik-pm-HB00000XYZ"
+CATEGORY = "https://www.hepsiburada.com/telefon-kiliflari-c-60001"
+
+
+@pytest.fixture
+def scraper():
+    # Driver ilk kullanımda açılır; bu testler Chrome'a hiç dokunmaz
+    return ProductLinkScraper()
+
+
+# ── _parse_review_count ──
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("(1.234)", 1234),
+        ("(12)", 12),
+        ("1,234", 1234),
+        ("(1.234.567)", 1234567),
+        ("(1.234 yorum)", 1234),
+        ("Değerlendirme (56)", 56),
+    ],
+)
+def test_parse_review_count(text, expected):
+    assert ProductLinkScraper._parse_review_count(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "()", "yorum yok"])
+def test_parse_review_count_without_number(text):
+    with pytest.raises(ValueError):
+        ProductLinkScraper._parse_review_count(text)
+
+
+# ── _resume_links (.part) ──
+def test_resume_links_missing_file(scraper, tmp_path):
+    scraper._resume_links(tmp_path / "links.part")
+    assert scraper.collected_links == set()
+
+
+def test_resume_links_skips_truncated_last_line(scraper, tmp_path):
+    part = tmp_path / "links.part"
+    part.write_text(f"{LINK_A}\n{LINK_B[:30]}", encoding="utf-8")
+
+    scraper._resume_links(part)
+    assert scraper.collected_links == {LINK_A}
+    assert scraper.progress.valid_products == 1
+
+
+def test_resume_links_skips_invalid_lines_and_duplicates(scraper, tmp_path):
+    part = tmp_path / "links.part"
+    part.write_text(
+        f"{LINK_A}\n\n#3 {CATEGORY}\nhttps://www.hepsiburada.com/kampanyalar\n{LINK_B}\n{LINK_A}\n",
+        encoding="utf-8",
+    )
+
+    scraper._resume_links(part)
+    assert scraper.collected_links == {LINK_A, LINK_B}
+    assert scraper.progress.valid_products == 2
+
+
+def test_resume_links_tolerates_cut_utf8(scraper, tmp_path):
+    part = tmp_path / "links.part"
+    part.write_bytes(f"{LINK_A}\n".encode() + "https://www.hepsiburada.com/kılıf".encode()[:-1])
+
+    scraper._resume_links(part)
+    assert scraper.collected_links == {LINK_A}
+
+
+# ── _resume_page_marks (.pages) ──
+def test_resume_page_marks_keeps_highest_page(scraper, tmp_path):
+    pages = tmp_path / "links.pages"
+    other = "https://www.hepsiburada.com/kulakliklar-c-60002"
+    pages.write_text(f"1 {CATEGORY}\n3 {CATEGORY}\n2 {CATEGORY}\n3 {CATEGORY}\n5 {other}\n", encoding="utf-8")
+
+    scraper._resume_page_marks(pages)
+    assert scraper._resume_pages == {CATEGORY: 3, other: 5}
+
+
+def test_resume_page_marks_skips_bad_markers(scraper, tmp_path):
+    pages = tmp_path / "links.pages"
+    pages.write_text(
+        f"2 {CATEGORY}\nx {CATEGORY}\n7\n#4 {CATEGORY}\n\n9 {CATEGORY}",  # son satır yarım
+        encoding="utf-8",
+    )
+
+    scraper._resume_page_marks(pages)
+    assert scraper._resume_pages == {CATEGORY: 2}
+
+
+def test_mark_page_round_trip(scraper, tmp_path):
+    pages = tmp_path / "links.pages"
+    with open(pages, "a", encoding="utf-8") as scraper._pages_fp:
+        scraper._mark_page(CATEGORY, 4)
+        scraper._mark_page(CATEGORY, 5)
+    scraper._pages_fp = None
+
+    scraper._resume_page_marks(pages)
+    assert scraper._resume_pages == {CATEGORY: 5}
@@ -0,0 +1,84 @@
+"""src/ai_analysis/rate_limit.py — RPM/TPM token bucket (sahte saatle)."""
+
+import asyncio
+
+import pytest
+
+from src.ai_analysis import rate_limit
+from src.ai_analysis.rate_limit import TokenBucket
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(rate_limit)
+
+
+def test_burst_up_to_capacity(clock):
+    bucket = TokenBucket(rpm=60, tpm=1_000_000)
+    for _ in range(60):
+        assert bucket._try_acquire(1, 0) == 0.0
+    # Kova boş: saniyede 1 istek dolar
+    assert bucket._try_acquire(1, 0) == pytest.approx(1.0)
+
+
+def test_refill_over_time(clock):
+    bucket = TokenBucket(rpm=60, tpm=1_000_000)
+    for _ in range(60):
+        bucket._try_acquire(1, 0)
+
+    clock.now += 0.5
+    assert bucket._try_acquire(1, 0) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket._try_acquire(1, 0) == 0.0
+
+
+def test_refill_capped_at_capacity(clock):
+    bucket = TokenBucket(rpm=60, tpm=1_000_000)
+    bucket._try_acquire(10, 0)
+
+    clock.now += 3600  # uzun bekleme kapasiteyi aşmaz
+    for _ in range(60):
+        assert bucket._try_acquire(1, 0) == 0.0
+    assert bucket._try_acquire(1, 0) > 0
+
+
+def test_token_bucket_limits_independently(clock):
+    bucket = TokenBucket(rpm=1000, tpm=600)  # saniyede 10 token
+    assert bucket._try_acquire(1, 600) == 0.0
+    assert bucket._try_acquire(1, 300) == pytest.approx(30.0)
+
+
+def test_oversized_request_waits_for_full_bucket(clock):
+    bucket = TokenBucket(rpm=60, tpm=600)
+    bucket._try_acquire(1, 300)
+
+    # Kapasiteden büyük istek kova dolunca geçer, sonsuza kadar beklemez
+    assert bucket._try_acquire(1, 10_000) == pytest.approx(30.0)
+    clock.now += 30
+    assert bucket._try_acquire(1, 10_000) == 0.0
+
+
+def test_acquire_sleeps_until_available(clock):
+    bucket = TokenBucket(rpm=60, tpm=1_000_000)
+    for _ in range(60):
+        bucket.acquire(1, 0)
+    assert clock.sleeps == []
+
+    bucket.acquire(1, 0)
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+def test_aacquire_uses_asyncio_sleep(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rpm=60, tpm=1_000_000)
+    bucket._try_acquire(60, 0)
+
+    asyncio.run(bucket.aacquire(1, 0))
+    assert sum(slept) == pytest.approx(1.0)
+    assert clock.sleeps == []  # time.sleep hiç çağrılmadı
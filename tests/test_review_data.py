@@ -0,0 +1,71 @@
+"""src/data_processing/review_data.py — yorumları ürün ürün okuma."""
+
+import csv
+
+import pytest
+
+from src.data_processing import review_data
+from src.data_processing.review_data import iter_grouped_reviews
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["product_id", "review", "rating"])
+        writer.writerows((product_id, review, 5) for product_id, review in rows)
+    return path
+
+
+@pytest.fixture(params=[65_536, 2], ids=["one-batch", "small-batches"])
+def batch_rows(request, monkeypatch):
+    monkeypatch.setattr(review_data, "READ_BATCH_ROWS", request.param)
+    return request.param
+
+
+def test_contiguous_products(tmp_path, batch_rows):
+    path = _write_csv(tmp_path / "reviews.csv", [
+        ("HB1", "a1"), ("HB1", "a2"), ("HB1", "a3"),
+        ("HB2", "b1"),
+        ("HB3", "c1"), ("HB3", "c2"),
+    ])
+    assert list(iter_grouped_reviews(path)) == [
+        ("HB1", ["a1", "a2", "a3"]), ("HB2", ["b1"]), ("HB3", ["c1", "c2"]),
+    ]
+
+
+def test_interleaved_products_in_last_row_order(tmp_path, batch_rows):
+    path = _write_csv(tmp_path / "reviews.csv", [
+        ("HB2", "b1"), ("HB1", "a1"), ("HB2", "b2"),
+        ("HB3", "c1"), ("HB1", "a2"), ("HB3", "c2"),
+    ])
+    assert list(iter_grouped_reviews(path)) == [
+        ("HB2", ["b1", "b2"]), ("HB1", ["a1", "a2"]), ("HB3", ["c1", "c2"]),
+    ]
+
+
+def test_empty_ids_and_reviews_skipped(tmp_path, batch_rows):
+    path = _write_csv(tmp_path / "reviews.csv", [
+        ("HB1", "a1"), ("", "sahipsiz"), ("HB2", ""),
+        ("HB3", "c1"), ("HB2", ""), ("HB1", ""),  # HB1'in son satırı boş yorum
+    ])
+    assert list(iter_grouped_reviews(path)) == [("HB3", ["c1"]), ("HB1", ["a1"])]
+
+
+def test_flushes_before_reading_rest_of_file(tmp_path, monkeypatch):
+    # Küçük batch'lerde ilk ürün dosyanın kalanı okunmadan üretilir
+    monkeypatch.setattr(review_data, "READ_BATCH_ROWS", 2)
+    path = _write_csv(tmp_path / "reviews.csv", [("HB1", "a1"), ("HB1", "a2")] + [("HB2", "b")] * 10)
+
+    reviews = iter_grouped_reviews(path)
+    assert next(reviews) == ("HB1", ["a1", "a2"])
+
+
+def test_parquet_reused_until_csv_changes(tmp_path):
+    path = _write_csv(tmp_path / "reviews.csv", [("HB1", "a1")])
+    list(iter_grouped_reviews(path))
+    parquet = review_data.reviews_parquet_path(path)
+    assert parquet.exists()
+
+    parquet_mtime = parquet.stat().st_mtime
+    list(iter_grouped_reviews(path))
+    assert parquet.stat().st_mtime == parquet_mtime